@@ -1,44 +1,119 @@
 """Click-based CLI interface for Beehive."""
 
-import subprocess
+import contextlib
+import functools
+import json
+import shutil
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 
-from beehive.core.git_ops import GitOperations
-from beehive.core.pr_creator import PRCreator
 from beehive.core.session import SessionManager, SessionStatus
 from beehive.core.tmux_manager import TmuxManager
 from beehive.core.config import BeehiveConfig
-from beehive.core.docker_manager import DockerManager
-from beehive.core.project_storage import ProjectStorage
+from beehive.utils.config import Config
+from beehive.utils.fs import atomic_write
 from beehive.cli_architect import architect
 from beehive.cli_project import project, cto
 from beehive.cli_researcher import researcher
 
 console = Console()
 
+_STATUS_STYLE = {
+    "running": "green",
+    "completed": "blue",
+    "failed": "red",
+    "stopped": "yellow",
+}
+_RUNTIME_DISPLAY = {
+    "docker": Text.from_markup("[magenta]docker[/magenta]"),
+    "host": Text.from_markup("[dim]host[/dim]"),
+}
+
+
+class _LazyContextObj(dict):
+    """ctx.obj mapping that builds expensive managers on first access.
+
+    Commands only pay for the managers they actually use; `.get()` and
+    `in` behave as if every factory-backed key were already present.
+    """
+
+    def __init__(self, factories: dict, **values):
+        super().__init__(**values)
+        self._factories = factories
+
+    def __missing__(self, key):
+        if key not in self._factories:
+            raise KeyError(key)
+        value = self[key] = self._factories.pop(key)()
+        return value
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._factories
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(name: str) -> bool:
+    """Check whether an executable is on PATH, once per process."""
+    return shutil.which(name) is not None
+
+
+def _maybe_status(message: str):
+    """Spinner for interactive terminals; a no-op (no render thread) otherwise."""
+    if console.is_terminal:
+        return console.status(message)
+    return contextlib.nullcontext()
+
+
+def _read_or_literal(value: str, label: str = "File") -> str:
+    """Resolve an `@file` argument to the file's contents; other values pass through.
+
+    Opens the file directly rather than stat-ing it first; exits with an
+    error if it doesn't exist.
+    """
+    if not value.startswith("@"):
+        return value
+    path = Path(value[1:])
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        console.print(f"[red]Error: {label} not found: {path}[/red]")
+        sys.exit(1)
+
+
+def _docker_manager():
+    from beehive.core.docker_manager import DockerManager
+
+    return DockerManager()
+
 
 @click.group()
 @click.option(
     "--data-dir",
     type=click.Path(path_type=Path),
-    default=Path.home() / ".beehive",
+    default=lambda: Config.DEFAULT_DATA_DIR,
     help="Data directory for Beehive sessions",
 )
 @click.pass_context
 def cli(ctx, data_dir: Path):
     """Beehive - Manage multiple Claude Code agent sessions."""
-    ctx.ensure_object(dict)
-    ctx.obj["data_dir"] = data_dir
-    ctx.obj["session_manager"] = SessionManager(data_dir)
-    ctx.obj["tmux"] = TmuxManager()
-    ctx.obj["config"] = BeehiveConfig(data_dir)
-    ctx.obj["docker"] = DockerManager()
+    ctx.obj = _LazyContextObj(
+        {
+            "session_manager": lambda: SessionManager(data_dir),
+            "tmux": TmuxManager,
+            "config": lambda: BeehiveConfig(data_dir),
+            "docker": _docker_manager,
+        },
+        **(ctx.obj or {}),
+        data_dir=data_dir,
+    )
 
 
 @cli.command()
@@ -53,7 +128,7 @@ def cli(ctx, data_dir: Path):
     "--working-dir",
     "-w",
     type=click.Path(exists=True, path_type=Path),
-    default=Path.cwd(),
+    default=lambda: Path.cwd(),
     help="Working directory (default: current directory)",
 )
 @click.option("--base-branch", "-b", default="main", help="Base branch (default: main)")
@@ -87,8 +162,11 @@ def create(
     no_docker: bool,
 ):
     """Create a new agent session."""
+    from beehive.core.git_ops import GitOperations, get_git_identity
+    from beehive.core.project_storage import ProjectStorage
+
     # Check tmux
-    if not ctx.obj["tmux"].check_tmux_installed():
+    if not _which_cached("tmux"):
         console.print(
             "[red]Error: tmux not found. Please install tmux first.[/red]"
         )
@@ -96,6 +174,17 @@ def create(
         console.print("  Ubuntu: sudo apt-get install tmux")
         sys.exit(1)
 
+    # Docker probing (docker info) and the git identity lookup are independent
+    # of the checks below, so start them in the background straight away
+    docker_mgr = ctx.obj["docker"]
+    docker_pool = None
+    if auto_approve and not no_docker:
+        from concurrent.futures import ThreadPoolExecutor
+
+        docker_pool = ThreadPoolExecutor(max_workers=2)
+        docker_available = docker_pool.submit(docker_mgr.is_available)
+        git_identity = docker_pool.submit(get_git_identity, working_dir)
+
     # Check if git repo
     git = GitOperations(working_dir)
     if not git.is_git_repo():
@@ -103,16 +192,10 @@ def create(
         sys.exit(1)
 
     # Parse instructions (file or string)
-    if instructions.startswith("@"):
-        instruction_file = Path(instructions[1:])
-        if not instruction_file.exists():
-            console.print(f"[red]Error: Instruction file not found: {instruction_file}[/red]")
-            sys.exit(1)
-        instructions = instruction_file.read_text()
+    instructions = _read_or_literal(instructions, "Instruction file")
 
     # Determine whether to use Docker
-    docker_mgr = ctx.obj["docker"]
-    use_docker = auto_approve and not no_docker and docker_mgr.is_available()
+    use_docker = docker_pool is not None and docker_available.result()
 
     # Combine with global system prompt (include deliverable instructions for auto-approve)
     config = ctx.obj["config"]
@@ -123,18 +206,22 @@ def create(
     )
 
     # Parse prompt (file or string)
-    if prompt and prompt.startswith("@"):
-        prompt_file = Path(prompt[1:])
-        if not prompt_file.exists():
-            console.print(f"[red]Error: Prompt file not found: {prompt_file}[/red]")
-            sys.exit(1)
-        prompt = prompt_file.read_text()
+    if prompt:
+        prompt = _read_or_literal(prompt, "Prompt file")
 
     # Create session
     session_mgr = ctx.obj["session_manager"]
 
+    # Check (or build) the Docker image in the background while the
+    # workspace is cloned and populated; it's only needed for the run command
+    image_ready = None
+    if docker_pool is not None:
+        if use_docker:
+            image_ready = docker_pool.submit(docker_mgr.ensure_image)
+        docker_pool.shutdown(wait=False)
+
     try:
-        with console.status("[bold green]Creating session..."):
+        with _maybe_status("[bold green]Creating session..."):
             session = session_mgr.create_session(
                 name, instructions, working_dir, base_branch,
                 use_docker=use_docker,
@@ -152,28 +239,24 @@ def create(
             # Copy project-specific CLAUDE.md into worktree, then
             # prepend global template on top (merge)
             if claude_md:
-                import shutil
-                shutil.copy2(claude_md, worktree_path / "CLAUDE.md")
+                shutil.copyfile(claude_md, worktree_path / "CLAUDE.md")
             config.inject_claude_md(worktree_path)
 
             # Write prompt files to worktree (avoids command-line quoting issues)
-            (worktree_path / ".beehive-system-prompt.txt").write_text(instructions)
+            writes = [(worktree_path / ".beehive-system-prompt.txt", instructions.encode())]
             if auto_approve and prompt:
-                (worktree_path / ".beehive-prompt.txt").write_text(prompt)
+                writes.append((worktree_path / ".beehive-prompt.txt", prompt.encode()))
 
             # Prepare Docker-specific gitconfig (writable, with user identity)
             if use_docker:
-                git_name = subprocess.run(
-                    ["git", "config", "user.name"],
-                    capture_output=True, text=True,
-                ).stdout.strip() or "Beehive Agent"
-                git_email = subprocess.run(
-                    ["git", "config", "user.email"],
-                    capture_output=True, text=True,
-                ).stdout.strip() or "agent@beehive"
-                (worktree_path / ".beehive-gitconfig").write_text(
-                    f"[user]\n\tname = {git_name}\n\temail = {git_email}\n"
-                )
+                git_name, git_email = git_identity.result()
+                writes.append((
+                    worktree_path / ".beehive-gitconfig",
+                    f"[user]\n\tname = {git_name}\n\temail = {git_email}\n".encode(),
+                ))
+
+            for path, data in writes:
+                atomic_write(path, data)
 
             # Detect project preview config for port forwarding
             preview_project = None
@@ -195,7 +278,7 @@ def create(
             # Build docker command if using Docker
             docker_command = None
             if use_docker:
-                if not docker_mgr.ensure_image():
+                if not image_ready.result():
                     console.print("[yellow]Warning: Failed to build Docker image, falling back to host.[/yellow]")
                     use_docker = False
                     session_mgr.update_session(
@@ -263,6 +346,42 @@ def create(
         sys.exit(1)
 
 
+_PLAIN_LIST_THRESHOLD = 50
+
+
+def _print_plain_session_rows(sessions) -> None:
+    """Print sessions as fixed-width lines, colouring only the status column."""
+    headers = ("ID", "Name", "Status", "Runtime", "Branch", "Created")
+    rows = [
+        (
+            s.session_id,
+            s.name,
+            s.status,
+            s.runtime,
+            s.branch_name,
+            s.created_at.strftime("%Y-%m-%d %H:%M"),
+        )
+        for s in sessions
+    ]
+    widths = [
+        max(len(header), *(len(row[i]) for row in rows))
+        for i, header in enumerate(headers)
+    ]
+
+    console.print(
+        "  ".join(h.ljust(w) for h, w in zip(headers, widths)),
+        style="bold", markup=False, highlight=False, soft_wrap=True,
+    )
+    for row in rows:
+        line = Text()
+        for i, (cell, width) in enumerate(zip(row, widths)):
+            if i:
+                line.append("  ")
+            style = _STATUS_STYLE.get(cell, "white") if i == 2 else None
+            line.append(cell.ljust(width), style=style)
+        console.print(line, highlight=False, soft_wrap=True)
+
+
 @cli.command()
 @click.option(
     "--status",
@@ -270,17 +389,29 @@ def create(
     type=click.Choice(["running", "completed", "failed", "stopped"]),
     help="Filter by status",
 )
+@click.option("--json", "json_out", is_flag=True, help="Output sessions as JSON")
 @click.pass_context
-def list(ctx, status: Optional[str]):
+def list(ctx, status: Optional[str], json_out: bool):
     """List all agent sessions."""
     session_mgr = ctx.obj["session_manager"]
     status_filter = SessionStatus(status) if status else None
     sessions = session_mgr.list_sessions(status_filter)
 
+    if json_out:
+        click.echo(json.dumps([s.model_dump(mode="json") for s in sessions]))
+        return
+
+    from rich.table import Table
+
     if not sessions:
         console.print("[dim]No sessions found.[/dim]")
         return
 
+    # Table layout measures every cell up front; long lists get plain rows
+    if len(sessions) >= _PLAIN_LIST_THRESHOLD:
+        _print_plain_session_rows(sessions)
+        return
+
     table = Table(title="Beehive Sessions")
     table.add_column("ID", style="cyan")
     table.add_column("Name")
@@ -290,23 +421,11 @@ def list(ctx, status: Optional[str]):
     table.add_column("Created")
 
     for s in sessions:
-        status_color = {
-            "running": "green",
-            "completed": "blue",
-            "failed": "red",
-            "stopped": "yellow",
-        }.get(s.status, "white")
-
-        runtime_display = (
-            f"[magenta]docker[/magenta]" if s.runtime == "docker"
-            else f"[dim]host[/dim]"
-        )
-
         table.add_row(
             s.session_id,
             s.name,
-            f"[{status_color}]{s.status}[/{status_color}]",
-            runtime_display,
+            Text(s.status, style=_STATUS_STYLE.get(s.status, "white")),
+            _RUNTIME_DISPLAY.get(s.runtime, _RUNTIME_DISPLAY["host"]),
             s.branch_name,
             s.created_at.strftime("%Y-%m-%d %H:%M"),
         )
@@ -319,6 +438,8 @@ def list(ctx, status: Optional[str]):
 @click.pass_context
 def attach(ctx, session_id: str):
     """Attach to agent's tmux session (interactive)."""
+    import os
+
     session = ctx.obj["session_manager"].get_session(session_id)
     if not session:
         console.print(f"[red]Session {session_id} not found[/red]")
@@ -331,7 +452,8 @@ def attach(ctx, session_id: str):
 
     console.print(f"Attaching to [bold]{session.name}[/bold]...")
     console.print("[dim]Press Ctrl+B then D to detach[/dim]\n")
-    ctx.obj["tmux"].attach_session(session.tmux_session_name)
+    # Replace this process with tmux so Python isn't resident while attached
+    os.execvp("tmux", ["tmux", "attach-session", "-t", session.tmux_session_name])
 
 
 @cli.command()
@@ -350,12 +472,7 @@ def send(ctx, session_id: str, text: str):
         sys.exit(1)
 
     # Parse @file syntax
-    if text.startswith("@"):
-        text_file = Path(text[1:])
-        if not text_file.exists():
-            console.print(f"[red]Error: File not found: {text_file}[/red]")
-            sys.exit(1)
-        text = text_file.read_text()
+    text = _read_or_literal(text)
 
     ctx.obj["tmux"].send_keys(session.tmux_session_name, text)
     console.print(f"[green]✓[/green] Sent prompt to [bold]{session.name}[/bold]")
@@ -370,12 +487,16 @@ def logs(ctx, session_id: str, follow: bool, lines: int):
     """View session logs."""
     import os
 
-    session = ctx.obj["session_manager"].get_session(session_id)
-    if not session:
-        console.print(f"[red]Session {session_id} not found[/red]")
-        sys.exit(1)
+    # Log files are named after the full session ID, so a full ID lets us
+    # exec tail without loading sessions.json; prefixes go through the lookup
+    log_file = ctx.obj["data_dir"] / "logs" / f"{session_id}.log"
+    if "/" in session_id or not log_file.is_file():
+        session = ctx.obj["session_manager"].get_session(session_id)
+        if not session:
+            console.print(f"[red]Session {session_id} not found[/red]")
+            sys.exit(1)
+        log_file = Path(session.log_file)
 
-    log_file = Path(session.log_file)
     if not log_file.exists():
         console.print(f"[yellow]Log file not found yet: {log_file}[/yellow]")
         console.print("[dim]The session may not have started yet.[/dim]")
@@ -397,13 +518,17 @@ def logs(ctx, session_id: str, follow: bool, lines: int):
 @click.pass_context
 def pr(ctx, session_id: str, title: Optional[str], draft: bool, base: str):
     """Create PR from agent's work."""
+    import subprocess
+
+    from beehive.core.pr_creator import PRCreator
+
     session = ctx.obj["session_manager"].get_session(session_id)
     if not session:
         console.print(f"[red]Session {session_id} not found[/red]")
         sys.exit(1)
 
     # Check gh CLI
-    if not PRCreator.check_gh_installed():
+    if not _which_cached("gh"):
         console.print("[red]Error: gh CLI not found. Please install it first.[/red]")
         console.print("  macOS: brew install gh")
         console.print("  Ubuntu: sudo apt-get install gh")
@@ -411,12 +536,11 @@ def pr(ctx, session_id: str, title: Optional[str], draft: bool, base: str):
 
     try:
         # Stop tmux session
-        if ctx.obj["tmux"].session_exists(session.tmux_session_name):
-            console.print("Stopping agent...")
-            ctx.obj["tmux"].kill_session(session.tmux_session_name)
+        if ctx.obj["tmux"].kill_session(session.tmux_session_name):
+            console.print("Stopped agent")
 
         # Create PR (use original repo for git operations, but worktree has the changes)
-        with console.status("[bold green]Creating PR..."):
+        with _maybe_status("[bold green]Creating PR..."):
             pr_creator = PRCreator(Path(session.working_directory))
             pr_url = pr_creator.create_pr(session.branch_name, base, title, draft, session)
 
@@ -456,13 +580,11 @@ def stop(ctx, session_id: str):
 
     # Stop Docker container if applicable
     if session.runtime == "docker":
-        docker_mgr = ctx.obj["docker"]
-        if docker_mgr.container_running(session.session_id):
-            docker_mgr.stop_container(session.session_id)
+        # Containers run with --rm, so stopping a finished one just fails
+        if ctx.obj["docker"].stop_container(session.session_id):
             console.print(f"[dim]Stopped container beehive-{session.session_id}[/dim]")
 
-    if ctx.obj["tmux"].session_exists(session.tmux_session_name):
-        ctx.obj["tmux"].kill_session(session.tmux_session_name)
+    if ctx.obj["tmux"].kill_session(session.tmux_session_name):
         console.print(f"[green]✓[/green] Stopped [bold]{session.name}[/bold]")
     else:
         console.print(f"[yellow]tmux session already stopped[/yellow]")
@@ -472,8 +594,9 @@ def stop(ctx, session_id: str):
 
 @cli.command()
 @click.argument("session_id")
+@click.option("--json", "json_out", is_flag=True, help="Output status as JSON")
 @click.pass_context
-def status(ctx, session_id: str):
+def status(ctx, session_id: str, json_out: bool):
     """Show detailed status of a session."""
     session = ctx.obj["session_manager"].get_session(session_id)
     if not session:
@@ -482,11 +605,25 @@ def status(ctx, session_id: str):
 
     # Check tmux status
     tmux_running = ctx.obj["tmux"].session_exists(session.tmux_session_name)
+    container_up = None
+    if session.runtime == "docker":
+        container_up = ctx.obj["docker"].container_running(session.session_id)
+
+    if json_out:
+        data = session.model_dump(mode="json")
+        data["tmux_running"] = tmux_running
+        data["container_running"] = container_up
+        click.echo(json.dumps(data))
+        return
 
     console.print(f"\n[bold]Session: {session.name}[/bold]")
     console.print(f"  ID: [cyan]{session.session_id}[/cyan]")
-    console.print(f"  Status: [{session.status}]{session.status}[/{session.status}]")
-    console.print(f"  Runtime: {'[magenta]docker[/magenta]' if session.runtime == 'docker' else '[dim]host[/dim]'}")
+    console.print(
+        Text.assemble("  Status: ", (session.status, _STATUS_STYLE.get(session.status, "white")))
+    )
+    console.print(
+        Text.assemble("  Runtime: ", _RUNTIME_DISPLAY.get(session.runtime, _RUNTIME_DISPLAY["host"]))
+    )
     console.print(f"  Branch: [yellow]{session.branch_name}[/yellow]")
     console.print(f"  Original Repo: {session.original_repo}")
     console.print(f"  Worktree: {session.working_directory}")
@@ -501,8 +638,6 @@ def status(ctx, session_id: str):
         f"[/{'green' if tmux_running else 'red'}]"
     )
     if session.runtime == "docker":
-        docker_mgr = ctx.obj["docker"]
-        container_up = docker_mgr.container_running(session.session_id)
         console.print(
             f"  Container: [{'green' if container_up else 'red'}]"
             f"{session.container_name} ({'running' if container_up else 'stopped'})"
@@ -552,24 +687,22 @@ def delete(ctx, session_id: str, force: bool):
 
     # Stop Docker container if applicable
     if session.runtime == "docker":
-        docker_mgr = ctx.obj["docker"]
-        if docker_mgr.container_running(session.session_id):
-            docker_mgr.stop_container(session.session_id)
+        ctx.obj["docker"].stop_container(session.session_id)
 
     # Stop tmux session if running
-    if ctx.obj["tmux"].session_exists(session.tmux_session_name):
-        ctx.obj["tmux"].kill_session(session.tmux_session_name)
+    ctx.obj["tmux"].kill_session(session.tmux_session_name)
 
     # Remove workspace (worktree for host, cloned dir for docker)
     try:
         worktree_path = Path(session.working_directory)
         if session.runtime == "docker":
             # Docker sessions use a cloned repo — just remove the directory
-            import shutil
             if worktree_path.exists():
                 shutil.rmtree(worktree_path)
                 console.print(f"[dim]Removed clone: {worktree_path}[/dim]")
         else:
+            from beehive.core.git_ops import GitOperations
+
             git = GitOperations(Path(session.original_repo))
             if git.worktree_exists(worktree_path):
                 git.remove_worktree(worktree_path, force=True)
@@ -638,12 +771,7 @@ def claude_md_set(ctx, content: str):
     """Set the CLAUDE.md template from a string or @file."""
     config = ctx.obj["config"]
 
-    if content.startswith("@"):
-        filepath = Path(content[1:])
-        if not filepath.exists():
-            console.print(f"[red]Error: File not found: {filepath}[/red]")
-            sys.exit(1)
-        content = filepath.read_text()
+    content = _read_or_literal(content)
 
     config.set_claude_md(content)
     console.print(f"[green]✓[/green] CLAUDE.md template saved to {config.get_claude_md_path()}")
@@ -660,18 +788,19 @@ def preview(ctx):
 @click.pass_context
 def preview_list(ctx):
     """Show all active preview environments."""
+    from rich.table import Table
+
     from beehive.core.preview import PreviewManager
     from beehive.core.architect_storage import ArchitectStorage
 
     data_dir = ctx.obj["data_dir"]
     preview_mgr = PreviewManager(data_dir)
 
-    # Clean up dead previews first
-    removed = preview_mgr.cleanup_dead_previews()
+    # Dead previews are dropped in the same pass
+    previews, removed = preview_mgr.list_previews_with_cleanup()
     if removed:
         console.print(f"[dim]Cleaned up {removed} dead preview(s).[/dim]")
 
-    previews = preview_mgr.list_previews()
     if not previews:
         console.print("[dim]No active previews.[/dim]")
         return
@@ -693,12 +822,9 @@ def preview_list(ctx):
     table.add_column("Type")
     table.add_column("Name")
     table.add_column("PID", style="dim")
-    table.add_column("Alive")
 
+    # Only live previews are listed; dead ones were dropped by the cleanup pass
     for p in sorted(previews, key=lambda x: x.port):
-        alive = PreviewManager._is_process_alive(p.pid)
-        alive_display = "[green]yes[/green]" if alive else "[red]no[/red]"
-
         if p.session_id in plan_info:
             arch_name, directive = plan_info[p.session_id]
             preview_type = "plan"
@@ -714,7 +840,6 @@ def preview_list(ctx):
             preview_type,
             name,
             str(p.pid),
-            alive_display,
         )
 
     console.print(table)
@@ -1,31 +1,50 @@
 """CLI commands for the Architect feature."""
 
-import json
+import os
 import re
+import signal
 import subprocess
 import sys
+import threading
+import time
+from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
 import click
-import yaml
-from rich.console import Console
-from rich.table import Table
+from rich.console import Console, Group
+from rich.text import Text
 
+from beehive.cli_common import assign_lock, ctx_service, image_lock, run_assign_batch, session_stack
 from beehive.core.architect import Architect, ArchitectRepo, TicketStatus
-from beehive.core.architect_storage import ArchitectStorage
-from beehive.core.project_storage import ProjectStorage
+from beehive.utils.config import Config
+from beehive.utils.fs import atomic_write
+from beehive.utils.serialization import json_loads
 
 console = Console()
 
+_TICKET_STATUS_STYLE = {
+    "pending": "yellow",
+    "assigned": "blue",
+    "in_progress": "green",
+    "completed": "green",
+    "failed": "red",
+    "merged": "cyan",
+}
+_TERMINAL_STATUSES = frozenset({TicketStatus.MERGED, TicketStatus.FAILED})
+
 
 @click.group()
 @click.pass_context
 def architect(ctx):
     """Manage architects, plans, and tickets."""
+    from beehive.core.architect_storage import ArchitectStorage
+
     ctx.ensure_object(dict)
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
     ctx.obj["architect_storage"] = ArchitectStorage(data_dir)
 
 
@@ -34,14 +53,19 @@ def architect(ctx):
 def list_architects(ctx):
     """List all architects."""
     storage = ctx.obj["architect_storage"]
-    architects = storage.load_all_architects()
+    # Only listing fields are needed, so plans aren't loaded into models
+    architects = storage.load_summaries()
 
     if not architects:
         console.print("[dim]No architects found.[/dim]")
         return
 
+    from rich.table import Table
+
+    from beehive.core.project_storage import ProjectStorage
+
     # Build architect_id → project_name map
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
     project_storage = ProjectStorage(data_dir)
     arch_to_project = {}
     for proj in project_storage.load_all_projects():
@@ -57,15 +81,14 @@ def list_architects(ctx):
     table.add_column("Created")
 
     for a in architects:
-        repo_names = ", ".join(r.name for r in a.repos)
-        project_name = arch_to_project.get(a.architect_id)
+        project_name = arch_to_project.get(a["architect_id"])
         table.add_row(
-            a.architect_id,
-            a.name,
+            a["architect_id"],
+            a["name"],
             project_name if project_name else "[dim]—[/dim]",
-            repo_names,
-            str(len(a.plans)),
-            a.created_at.strftime("%Y-%m-%d %H:%M"),
+            ", ".join(a["repo_names"]),
+            str(a["plan_count"]),
+            a["created_at"].strftime("%Y-%m-%d %H:%M"),
         )
 
     console.print(table)
@@ -90,8 +113,11 @@ def list_architects(ctx):
 @click.pass_context
 def create_architect(ctx, name: str, config_file: Path, project: str):
     """Create a new architect from a YAML config file."""
+    from beehive.core.project_storage import ProjectStorage
+    from beehive.utils.yaml_cache import load_yaml_config
+
     storage = ctx.obj["architect_storage"]
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
 
     # Validate project exists
     project_storage = ProjectStorage(data_dir)
@@ -100,24 +126,22 @@ def create_architect(ctx, name: str, config_file: Path, project: str):
         console.print(f"[red]Error: Project '{project}' not found.[/red]")
         sys.exit(1)
 
-    # Parse YAML
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
+    # Parse YAML (re-runs against an unchanged file reuse the cached parse)
+    config = load_yaml_config(config_file, data_dir / ".yaml-cache")
 
     # Build repos
-    repos = []
-    for repo_data in config.get("repos", []):
-        repo_path = Path(repo_data["path"])
-        if not repo_path.exists():
-            console.print(f"[yellow]Warning: repo path does not exist: {repo_path}[/yellow]")
-        repos.append(
-            ArchitectRepo(
-                name=repo_data["name"],
-                path=str(repo_path),
-                base_branch=repo_data.get("base_branch", "main"),
-                description=repo_data.get("description", ""),
-            )
+    repos = [
+        ArchitectRepo(
+            name=repo_data["name"],
+            path=str(Path(repo_data["path"])),
+            base_branch=repo_data.get("base_branch", "main"),
+            description=repo_data.get("description", ""),
         )
+        for repo_data in config.get("repos", [])
+    ]
+    for repo in repos:
+        if not os.path.lexists(repo.path):
+            console.print(f"[yellow]Warning: repo path does not exist: {repo.path}[/yellow]")
 
     if not repos:
         console.print("[red]Error: No repos defined in config.[/red]")
@@ -154,21 +178,25 @@ def show_architect(ctx, architect_id: str):
         console.print(f"[red]Architect {architect_id} not found[/red]")
         sys.exit(1)
 
-    console.print(f"\n[bold]Architect: {arch.name}[/bold]")
-    console.print(f"  ID: [cyan]{arch.architect_id}[/cyan]")
-    console.print(f"  Created: {arch.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    console.print(f"\n[bold]Principles:[/bold]")
-    console.print(f"  {arch.principles}")
-    console.print(f"\n[bold]Repos:[/bold]")
+    # Collected and rendered with a single print
+    lines = [
+        f"\n[bold]Architect: {arch.name}[/bold]",
+        f"  ID: [cyan]{arch.architect_id}[/cyan]",
+        f"  Created: {arch.created_at.strftime('%Y-%m-%d %H:%M:%S')}",
+        "\n[bold]Principles:[/bold]",
+        f"  {arch.principles}",
+        "\n[bold]Repos:[/bold]",
+    ]
     for r in arch.repos:
         desc = f" - {r.description}" if r.description else ""
-        console.print(f"  [cyan]{r.name}[/cyan]: {r.path} (base: {r.base_branch}){desc}")
-    console.print(f"\n[bold]Plans:[/bold] {len(arch.plans)}")
+        lines.append(f"  [cyan]{r.name}[/cyan]: {r.path} (base: {r.base_branch}){desc}")
+    lines.append(f"\n[bold]Plans:[/bold] {len(arch.plans)}")
     for p in arch.plans:
-        console.print(
+        lines.append(
             f"  [cyan]{p.plan_id}[/cyan]: {p.directive[:60]} "
             f"({len(p.tickets)} tickets)"
         )
+    console.print(Group(*lines))
 
 
 @architect.command("plan")
@@ -243,7 +271,7 @@ def create_plan(ctx, architect_id: str, directive: str, auto_merge: bool):
 def list_tickets(ctx, architect_id: str, plan_id: Optional[str]):
     """List tickets for an architect's plan."""
     storage = ctx.obj["architect_storage"]
-    arch = storage.load_architect(architect_id)
+    arch = storage.load_architect_meta(architect_id)
 
     if not arch:
         console.print(f"[red]Architect {architect_id} not found[/red]")
@@ -256,11 +284,10 @@ def list_tickets(ctx, architect_id: str, plan_id: Optional[str]):
             sys.exit(1)
     else:
         # Use latest plan
-        plans = arch.plans
-        if not plans:
+        plan = storage.load_latest_plan(arch.architect_id)
+        if not plan:
             console.print("[dim]No plans found for this architect.[/dim]")
             return
-        plan = plans[-1]
 
     console.print(f"[bold]Plan {plan.plan_id}[/bold]: {plan.directive}\n")
     _print_tickets_table(plan.tickets)
@@ -289,14 +316,13 @@ def edit_ticket(ctx, ticket_id: str, title: Optional[str], description: Optional
         ticket.description = description
     if repo:
         # Validate repo name
-        valid_repos = {r.name for r in arch.repos}
-        if repo not in valid_repos:
-            console.print(f"[red]Invalid repo '{repo}'. Valid: {', '.join(valid_repos)}[/red]")
+        if arch.get_repo(repo) is None:
+            valid_repos = ", ".join(r.name for r in arch.repos)
+            console.print(f"[red]Invalid repo '{repo}'. Valid: {valid_repos}[/red]")
             sys.exit(1)
         ticket.repo = repo
 
-    ticket.updated_at = datetime.utcnow()
-    plan.updated_at = datetime.utcnow()
+    ticket.updated_at = plan.updated_at = datetime.utcnow()
     storage.save_plan(arch.architect_id, plan)
 
     console.print(f"[green]✓[/green] Updated ticket [cyan]{ticket.ticket_id}[/cyan]")
@@ -308,7 +334,7 @@ def _build_plan_context(current_ticket, plan) -> Optional[str]:
     Returns None for single-ticket plans or parallel plans where
     ordering doesn't matter.
     """
-    sorted_tickets = sorted(plan.tickets, key=lambda t: t.order)
+    sorted_tickets = plan.sorted_tickets
     if len(sorted_tickets) <= 1:
         return None
 
@@ -320,28 +346,30 @@ def _build_plan_context(current_ticket, plan) -> Optional[str]:
 
     current_order = current_ticket.order
 
-    # Previous tickets (completed/merged work)
-    previous = [t for t in sorted_tickets if t.order < current_order]
+    # Single pass: previous (completed/merged work) and future (not yet started)
+    previous = []
+    future = []
+    for t in sorted_tickets:
+        if t.order < current_order:
+            previous.append(f"  #{t.order}. [{t.status!s}] {t.title}")
+            previous.append(f"     {t.description}")
+            previous.append("")
+        elif t.order > current_order:
+            future.append(f"  #{t.order}. {t.title}")
+            future.append(f"     {t.description}")
+            future.append("")
+
     if previous:
         lines.append("COMPLETED BEFORE YOUR TASK:")
-        for t in previous:
-            status = str(t.status)
-            lines.append(f"  #{t.order}. [{status}] {t.title}")
-            lines.append(f"     {t.description}")
-            lines.append("")
+        lines.extend(previous)
 
     # Current ticket marker
     lines.append(f">>> YOUR TASK (#{current_order}): {current_ticket.title}")
     lines.append("")
 
-    # Future tickets (not yet started)
-    future = [t for t in sorted_tickets if t.order > current_order]
     if future:
         lines.append("PLANNED AFTER YOUR TASK:")
-        for t in future:
-            lines.append(f"  #{t.order}. {t.title}")
-            lines.append(f"     {t.description}")
-            lines.append("")
+        lines.extend(future)
 
     lines.append(
         "IMPORTANT: Focus ONLY on your task. Do not implement work "
@@ -354,12 +382,18 @@ def _build_plan_context(current_ticket, plan) -> Optional[str]:
 
 def _assign_single_ticket(ticket, plan, arch, storage, data_dir,
                           session_mgr, tmux, config, docker_mgr,
-                          auto_approve, no_docker) -> Optional[str]:
-    """Assign a single ticket: create session, worktree, tmux. Returns session_id or None."""
-    from beehive.core.git_ops import GitOperations
+                          auto_approve, no_docker, save: bool = True,
+                          image_ready=None) -> Optional[str]:
+    """Assign a single ticket: create session, worktree, tmux. Returns session_id or None.
+
+    With save=False the plan is only mutated; the caller persists it.
+    image_ready is an optional Future for a docker_mgr.ensure_image() call
+    the caller already started (which implies Docker is available).
+    """
+    from beehive.core.git_ops import GitOperations, get_git_identity
     from beehive.core.tmux_manager import TmuxManager
 
-    repo_config = next((r for r in arch.repos if r.name == ticket.repo), None)
+    repo_config = arch.get_repo(ticket.repo)
     if not repo_config:
         console.print(f"[red]Repo '{ticket.repo}' not found in architect config[/red]")
         return None
@@ -371,7 +405,9 @@ def _assign_single_ticket(ticket, plan, arch, storage, data_dir,
         return None
 
     try:
-        use_docker = auto_approve and not no_docker and docker_mgr.is_available()
+        use_docker = auto_approve and not no_docker and (
+            image_ready is not None or docker_mgr.is_available()
+        )
 
         # Use plan's feature branch as base when available
         base = plan.base_branch if plan.base_branch else repo_config.base_branch
@@ -402,10 +438,14 @@ def _assign_single_ticket(ticket, plan, arch, storage, data_dir,
         else:
             git.create_worktree(session.branch_name, worktree_path, base)
 
+        # Looked up once; also supplies the preview config below
+        project = None
         project_claude_md = None
         try:
             project = _find_project_for_architect(arch.architect_id, data_dir)
             if project:
+                from beehive.core.project_storage import ProjectStorage
+
                 project_storage = ProjectStorage(data_dir)
                 project_claude_md = project_storage.get_project_claude_md(
                     project.project_id
@@ -414,20 +454,15 @@ def _assign_single_ticket(ticket, plan, arch, storage, data_dir,
             pass
         config.inject_claude_md(worktree_path, project_claude_md=project_claude_md)
 
-        (worktree_path / ".beehive-system-prompt.txt").write_text(instructions)
-
+        writes = [(worktree_path / ".beehive-system-prompt.txt", instructions.encode())]
         if use_docker:
-            git_name = subprocess.run(
-                ["git", "config", "user.name"],
-                capture_output=True, text=True,
-            ).stdout.strip() or "Beehive Agent"
-            git_email = subprocess.run(
-                ["git", "config", "user.email"],
-                capture_output=True, text=True,
-            ).stdout.strip() or "agent@beehive"
-            (worktree_path / ".beehive-gitconfig").write_text(
-                f"[user]\n\tname = {git_name}\n\temail = {git_email}\n"
-            )
+            git_name, git_email = get_git_identity(repo_path)
+            writes.append((
+                worktree_path / ".beehive-gitconfig",
+                f"[user]\n\tname = {git_name}\n\temail = {git_email}\n".encode(),
+            ))
+        for path, data in writes:
+            atomic_write(path, data)
 
         # Only start per-ticket previews for single-ticket plans.
         # Multi-ticket plans get a plan-level preview on the feature branch instead.
@@ -439,7 +474,7 @@ def _assign_single_ticket(ticket, plan, arch, storage, data_dir,
         preview_port = None
         if is_single_ticket:
             try:
-                preview_project = _find_project_for_architect(arch.architect_id, data_dir)
+                preview_project = project
                 if preview_project and preview_project.preview and use_docker:
                     from beehive.core.preview import PreviewManager
                     preview_mgr = PreviewManager(data_dir)
@@ -449,7 +484,12 @@ def _assign_single_ticket(ticket, plan, arch, storage, data_dir,
 
         docker_command = None
         if use_docker:
-            if not docker_mgr.ensure_image():
+            if image_ready is not None:
+                image_ok = image_ready.result()
+            else:
+                with image_lock:
+                    image_ok = docker_mgr.ensure_image()
+            if not image_ok:
                 console.print(f"[yellow]Warning: Docker image build failed, falling back to host for {ticket.title}[/yellow]")
                 use_docker = False
                 session_mgr.update_session(
@@ -479,12 +519,13 @@ def _assign_single_ticket(ticket, plan, arch, storage, data_dir,
             docker_command=docker_command,
         )
 
-        ticket.status = TicketStatus.ASSIGNED
-        ticket.session_id = session.session_id
-        ticket.branch_name = session.branch_name
-        ticket.updated_at = datetime.utcnow()
-        plan.updated_at = datetime.utcnow()
-        storage.save_plan(arch.architect_id, plan)
+        with assign_lock:
+            ticket.status = TicketStatus.ASSIGNED
+            ticket.session_id = session.session_id
+            ticket.branch_name = session.branch_name
+            ticket.updated_at = plan.updated_at = datetime.utcnow()
+            if save:
+                storage.save_plan(arch.architect_id, plan)
 
         # Start preview environment on the host (single-ticket plans only)
         if is_single_ticket:
@@ -534,18 +575,17 @@ def assign_tickets(ctx, architect_id: str, ticket_id: Optional[str], parallel: b
     --parallel: assigns all pending tickets at once.
     """
     storage = ctx.obj["architect_storage"]
-    arch = storage.load_architect(architect_id)
+    arch = storage.load_architect_meta(architect_id)
 
     if not arch:
         console.print(f"[red]Architect {architect_id} not found[/red]")
         sys.exit(1)
 
-    if not arch.plans:
+    plan = storage.load_latest_plan(arch.architect_id)
+    if not plan:
         console.print("[red]No plans found. Run 'architect plan' first.[/red]")
         sys.exit(1)
 
-    plan = arch.plans[-1]
-
     if ticket_id:
         result = storage.find_ticket(arch.architect_id, ticket_id)
         if not result:
@@ -554,8 +594,7 @@ def assign_tickets(ctx, architect_id: str, ticket_id: Optional[str], parallel: b
         plan, ticket = result
         tickets_to_assign = [ticket]
     else:
-        pending = [t for t in plan.tickets if t.status == TicketStatus.PENDING]
-        pending.sort(key=lambda t: t.order)
+        pending = [t for t in plan.sorted_tickets if t.status == TicketStatus.PENDING]
         if parallel:
             tickets_to_assign = pending
         else:
@@ -570,31 +609,38 @@ def assign_tickets(ctx, architect_id: str, ticket_id: Optional[str], parallel: b
     plan.execution_mode = "parallel" if parallel else "sequential"
     if auto_merge:
         plan.auto_merge = True
-    storage.save_plan(arch.architect_id, plan)
 
     auto_approve = not no_auto_approve
 
-    from beehive.core.session import SessionManager
-    from beehive.core.config import BeehiveConfig
-    from beehive.core.docker_manager import DockerManager
-    from beehive.core.tmux_manager import TmuxManager
-
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
-    session_mgr = ctx.obj.get("session_manager", SessionManager(data_dir))
-    tmux = ctx.obj.get("tmux", TmuxManager())
-    config = ctx.obj.get("config", BeehiveConfig(data_dir))
-    docker_mgr = ctx.obj.get("docker", DockerManager())
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
+    session_mgr, tmux, config, docker_mgr = session_stack(ctx)
 
     if not tmux.check_tmux_installed():
         console.print("[red]Error: tmux not found.[/red]")
         sys.exit(1)
 
-    for ticket in tickets_to_assign:
-        _assign_single_ticket(
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Check (or build) the agent image once for the whole batch, in the
+    # background so it overlaps with the first worktree setup
+    image_ready = None
+    if auto_approve and not no_docker and docker_mgr.is_available():
+        image_pool = ThreadPoolExecutor(max_workers=1)
+        image_ready = image_pool.submit(docker_mgr.ensure_image)
+        image_pool.shutdown(wait=False)
+    use_host = image_ready is None
+
+    run_assign_batch(
+        tickets_to_assign,
+        lambda ticket: _assign_single_ticket(
             ticket, plan, arch, storage, data_dir,
             session_mgr, tmux, config, docker_mgr,
-            auto_approve, no_docker,
-        )
+            auto_approve, use_host, save=False, image_ready=image_ready,
+        ),
+        lambda: storage.save_plan(arch.architect_id, plan),
+        "tickets",
+        parallel=True,
+    )
 
 
 @architect.command("status")
@@ -604,7 +650,7 @@ def assign_tickets(ctx, architect_id: str, ticket_id: Optional[str], parallel: b
 def plan_status(ctx, architect_id: str, plan_id: Optional[str]):
     """Sync ticket statuses from sessions and show plan progress."""
     storage = ctx.obj["architect_storage"]
-    arch = storage.load_architect(architect_id)
+    arch = storage.load_architect_meta(architect_id)
 
     if not arch:
         console.print(f"[red]Architect {architect_id} not found[/red]")
@@ -616,16 +662,13 @@ def plan_status(ctx, architect_id: str, plan_id: Optional[str]):
             console.print(f"[red]Plan {plan_id} not found[/red]")
             sys.exit(1)
     else:
-        if not arch.plans:
+        plan = storage.load_latest_plan(arch.architect_id)
+        if not plan:
             console.print("[dim]No plans found.[/dim]")
             return
-        plan = arch.plans[-1]
 
     # Sync ticket statuses from beehive sessions
-    from beehive.core.session import SessionManager
-
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
-    session_mgr = ctx.obj.get("session_manager", SessionManager(data_dir))
+    session_mgr = ctx_service(ctx, "session_manager")
 
     synced = _sync_tickets_from_sessions(plan, session_mgr)
     if synced:
@@ -633,15 +676,12 @@ def plan_status(ctx, architect_id: str, plan_id: Optional[str]):
         storage.save_plan(arch.architect_id, plan)
 
     # Summary
-    counts = {}
-    for t in plan.tickets:
-        counts[t.status] = counts.get(t.status, 0) + 1
-
-    summary_parts = []
-    for status_val in ["pending", "assigned", "in_progress", "completed", "merged", "failed"]:
-        count = counts.get(status_val, 0)
-        if count > 0:
-            summary_parts.append(f"{count} {status_val}")
+    counts = Counter(t.status for t in plan.tickets)
+    summary_parts = [
+        f"{counts[status_val]} {status_val}"
+        for status_val in ["pending", "assigned", "in_progress", "completed", "merged", "failed"]
+        if counts[status_val]
+    ]
 
     console.print(f"\n[bold]Plan {plan.plan_id}[/bold]: {plan.directive}")
     console.print(f"  Status: {', '.join(summary_parts)}\n")
@@ -654,11 +694,11 @@ def _find_pr_for_branch(branch_name: str, repo_path: str):
     try:
         result = subprocess.run(
             ["gh", "pr", "list", "--head", branch_name, "--state", "all", "--json", "url", "--limit", "1"],
-            capture_output=True, text=True, timeout=15,
+            capture_output=True, timeout=15,
             cwd=repo_path,
         )
         if result.returncode == 0:
-            data = json.loads(result.stdout)
+            data = json_loads(result.stdout)
             if data:
                 return data[0].get("url")
     except Exception:
@@ -666,42 +706,206 @@ def _find_pr_for_branch(branch_name: str, repo_path: str):
     return None
 
 
+def _branch_pushed(branch_name: str, repo_path: str) -> bool:
+    """Check the branch exists on origin (cheaper than gh, and needs no auth).
+
+    Only a definite "no such ref" answer returns False; other git errors
+    return True so callers still try gh.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-remote", "--exit-code", "--heads", "origin", branch_name],
+            capture_output=True, timeout=15,
+            cwd=repo_path,
+        )
+    except Exception:
+        return True
+    # --exit-code makes ls-remote exit 2 when no matching ref was found
+    return result.returncode != 2
+
+
+# Most PRs fetched by one `gh pr list` call per repo
+_PR_LIST_LIMIT = 200
+
+
+class _PRIndex(dict):
+    """PRs keyed by head branch and by URL.
+
+    ``complete`` is False when the listing hit _PR_LIST_LIMIT, so a
+    missing branch may just be older than the window.
+    """
+
+    complete = True
+
+
+def _list_prs_for_repo(repo_path: str) -> Optional[dict[str, dict]]:
+    """List a repo's recent PRs with one gh call, indexed by head branch and by URL.
+
+    Returns None if gh fails so callers can fall back to per-PR lookups.
+    """
+    try:
+        result = subprocess.run(
+            ["gh", "pr", "list", "--state", "all", "--limit", str(_PR_LIST_LIMIT),
+             "--json", "url,headRefName,state"],
+            capture_output=True, timeout=15,
+            cwd=repo_path,
+        )
+        if result.returncode != 0:
+            return None
+        listing = json_loads(result.stdout)
+        prs = _PRIndex()
+        prs.complete = len(listing) < _PR_LIST_LIMIT
+        # gh lists newest first; keep the newest PR for a reused branch name
+        for pr in listing:
+            prs.setdefault(pr["headRefName"], pr)
+            prs[pr["url"]] = pr
+        return prs
+    except Exception:
+        return None
+
+
+def _repo_prs(pr_cache: dict, repo_paths: dict, repo_name: str) -> Optional[dict[str, dict]]:
+    """Return the PR index for a repo, fetching it at most once per pr_cache."""
+    if repo_name not in pr_cache:
+        repo_path = repo_paths.get(repo_name)
+        pr_cache[repo_name] = _list_prs_for_repo(repo_path) if repo_path else None
+    return pr_cache[repo_name]
+
+
+def _gh_map(fn, items) -> list:
+    """Apply a gh-backed lookup to each item, overlapping the subprocess waits."""
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(items), 8)) as pool:
+        return [*pool.map(fn, items)]
+
+
+def _prefetch_repo_prs(pr_cache: dict, repo_paths: dict, repo_names) -> None:
+    """Fill pr_cache for every repo in repo_names, listing the repos concurrently."""
+    missing = sorted(name for name in repo_names if name not in pr_cache)
+    listings = _gh_map(
+        lambda name: _list_prs_for_repo(repo_paths[name]) if repo_paths.get(name) else None,
+        missing,
+    )
+    pr_cache.update(zip(missing, listings))
+
+
+def _discover_pr_urls(tickets, pr_cache: dict, repo_paths: dict) -> dict[str, Optional[str]]:
+    """Map ticket_id -> PR URL for each ticket's branch (None if no PR yet).
+
+    Branches are looked up in the repo's PR listing; tickets whose listing
+    failed, or whose branch is missing from a listing truncated at
+    _PR_LIST_LIMIT, fall back to per-branch gh calls, run concurrently and
+    only once the branch has been pushed.
+    """
+    urls = {}
+    fallback = []
+    for ticket in tickets:
+        prs = _repo_prs(pr_cache, repo_paths, ticket.repo)
+        pr = prs.get(ticket.branch_name) if prs is not None else None
+        if pr:
+            urls[ticket.ticket_id] = pr["url"]
+        elif prs is None or not getattr(prs, "complete", True):
+            fallback.append(ticket)
+        else:
+            urls[ticket.ticket_id] = None
+    found = _gh_map(
+        lambda t: (
+            _find_pr_for_branch(t.branch_name, repo_paths[t.repo])
+            if _branch_pushed(t.branch_name, repo_paths[t.repo]) else None
+        ),
+        fallback,
+    )
+    urls.update(zip((t.ticket_id for t in fallback), found))
+    return urls
+
+
+def _lookup_pr_states(tickets, pr_cache: dict, repo_paths: dict) -> dict[str, Optional[str]]:
+    """Map pr_url -> OPEN/MERGED/CLOSED (or None) for each ticket's PR.
+
+    PRs missing from the repo listing are fetched with concurrent
+    ``gh pr view`` calls.
+    """
+    states = {}
+    fallback = []
+    for ticket in tickets:
+        prs = _repo_prs(pr_cache, repo_paths, ticket.repo)
+        pr = prs.get(ticket.pr_url) if prs else None
+        if pr:
+            states[ticket.pr_url] = pr["state"]
+        else:
+            fallback.append(ticket.pr_url)
+    states.update(zip(fallback, _gh_map(_get_pr_state, fallback)))
+    return states
+
+
 def _get_pr_state(pr_url: str) -> Optional[str]:
     """Get a GitHub PR's state via `gh pr view`. Returns OPEN/MERGED/CLOSED or None."""
     try:
         result = subprocess.run(
             ["gh", "pr", "view", pr_url, "--json", "state"],
-            capture_output=True, text=True, timeout=15,
+            capture_output=True, timeout=15,
         )
         if result.returncode == 0:
-            data = json.loads(result.stdout)
+            data = json_loads(result.stdout)
             return data.get("state")
     except Exception:
         pass
     return None
 
 
-def _sync_tickets_from_sessions(plan, session_mgr) -> bool:
-    """Sync ticket statuses and PR URLs from beehive sessions. Returns True if any changes."""
+def _tickets_by_status(tickets) -> dict[str, list]:
+    """Group tickets into status buckets in one pass."""
+    by_status = defaultdict(list)
+    for t in tickets:
+        by_status[t.status].append(t)
+    return by_status
+
+
+def _sync_tickets_from_sessions(plan, session_mgr, active_tickets=None, sessions_by_id=None,
+                                now: Optional[datetime] = None) -> bool:
+    """Sync ticket statuses and PR URLs from beehive sessions. Returns True if any changes.
+
+    ``active_tickets`` may be passed as the plan's assigned/in-progress
+    tickets when the caller has already bucketed them by status.
+    The tickets' sessions are loaded in one read unless ``sessions_by_id``
+    is given.
+    """
+    if active_tickets is None:
+        active_tickets = [
+            t for t in plan.tickets
+            if t.status in (TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS)
+        ]
+    if not active_tickets:
+        return False
+    if sessions_by_id is None:
+        sessions_by_id = session_mgr.get_sessions(
+            t.session_id for t in active_tickets if t.session_id
+        )
+    if now is None:
+        now = datetime.utcnow()
+
     synced = False
-    for ticket in plan.tickets:
-        if ticket.status in (TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS) and ticket.session_id:
-            session = session_mgr.get_session(ticket.session_id)
+    for ticket in active_tickets:
+        if ticket.session_id:
+            session = sessions_by_id.get(ticket.session_id)
             if not session:
                 continue
 
             if session.status == "completed":
                 ticket.status = TicketStatus.COMPLETED
-                ticket.updated_at = datetime.utcnow()
+                ticket.updated_at = now
                 synced = True
             elif session.status in ("failed", "stopped"):
                 ticket.status = TicketStatus.FAILED
-                ticket.updated_at = datetime.utcnow()
+                ticket.updated_at = now
                 synced = True
 
             if session.pr_url and not ticket.pr_url:
                 ticket.pr_url = session.pr_url
-                ticket.updated_at = datetime.utcnow()
+                ticket.updated_at = now
                 synced = True
     return synced
 
@@ -720,10 +924,10 @@ def _get_pr_comments(pr_url: str) -> list[dict]:
         result = subprocess.run(
             ["gh", "api", f"repos/{owner}/{repo}/issues/{number}/comments",
              "--jq", '[.[] | {id: .id, body: .body, author: .user.login, created_at: .created_at}]'],
-            capture_output=True, text=True, timeout=15,
+            capture_output=True, timeout=15,
         )
         if result.returncode == 0 and result.stdout.strip():
-            return json.loads(result.stdout)
+            return json_loads(result.stdout)
     except Exception:
         pass
     return []
@@ -742,7 +946,7 @@ def _check_pr_comments(plan, arch, storage, data_dir, session_mgr, tmux, config,
     pr_targets = []  # list of (pr_url, target_branch)
 
     for ticket in plan.tickets:
-        if ticket.pr_url and ticket.status not in (TicketStatus.MERGED, TicketStatus.FAILED):
+        if ticket.pr_url and ticket.status not in _TERMINAL_STATUSES:
             # Target branch for ticket PRs is the plan's feature branch (or ticket's branch)
             target = plan.base_branch if plan.base_branch else ticket.branch_name
             if target:
@@ -755,8 +959,10 @@ def _check_pr_comments(plan, arch, storage, data_dir, session_mgr, tmux, config,
 
     processed = set(plan.processed_comment_ids)
 
-    for pr_url, target_branch in pr_targets:
-        comments = _get_pr_comments(pr_url)
+    # Fetch every PR's comments up front (concurrently), then process in order
+    all_comments = _gh_map(_get_pr_comments, [pr_url for pr_url, _ in pr_targets])
+
+    for (pr_url, target_branch), comments in zip(pr_targets, all_comments):
         for comment in comments:
             comment_id = comment["id"]
             if comment_id in processed:
@@ -827,7 +1033,7 @@ def _assign_feedback_ticket(ticket, plan, arch, storage, data_dir,
     from beehive.core.git_ops import GitOperations
     from beehive.core.tmux_manager import TmuxManager
 
-    repo_config = next((r for r in arch.repos if r.name == ticket.repo), None)
+    repo_config = arch.get_repo(ticket.repo)
     if not repo_config:
         console.print(f"[red]Repo '{ticket.repo}' not found in architect config[/red]")
         return None
@@ -872,6 +1078,8 @@ def _assign_feedback_ticket(ticket, plan, arch, storage, data_dir,
         try:
             project = _find_project_for_architect(arch.architect_id, data_dir)
             if project:
+                from beehive.core.project_storage import ProjectStorage
+
                 project_storage = ProjectStorage(data_dir)
                 project_claude_md = project_storage.get_project_claude_md(
                     project.project_id
@@ -893,8 +1101,7 @@ def _assign_feedback_ticket(ticket, plan, arch, storage, data_dir,
 
         ticket.status = TicketStatus.ASSIGNED
         ticket.session_id = session.session_id
-        ticket.updated_at = datetime.utcnow()
-        plan.updated_at = datetime.utcnow()
+        ticket.updated_at = plan.updated_at = datetime.utcnow()
         storage.save_plan(arch.architect_id, plan)
 
         console.print(
@@ -927,7 +1134,7 @@ def _maybe_start_plan_preview(plan, arch, storage, data_dir: Path) -> None:
         return
 
     # Find the repo for the worktree
-    repo_config = next((r for r in arch.repos if r.name == non_feedback_tickets[0].repo), None)
+    repo_config = arch.get_repo(non_feedback_tickets[0].repo)
     if not repo_config:
         return
 
@@ -994,11 +1201,13 @@ def _refresh_plan_preview(plan, data_dir: Path) -> None:
 @click.option("--interval", "-i", default=15, help="Polling interval in seconds")
 @click.pass_context
 def watch_plan(ctx, architect_id: str, plan_id: Optional[str], interval: int):
-    """Watch plan execution: sync statuses, detect merges, auto-assign next ticket."""
-    import time
+    """Watch plan execution: sync statuses, detect merges, auto-assign next ticket.
 
+    Polling backs off to 4x the interval while nothing changes. Send the
+    watcher SIGUSR1 to make it poll immediately.
+    """
     storage = ctx.obj["architect_storage"]
-    arch = storage.load_architect(architect_id)
+    arch = storage.load_architect_meta(architect_id)
 
     if not arch:
         console.print(f"[red]Architect {architect_id} not found[/red]")
@@ -1010,72 +1219,103 @@ def watch_plan(ctx, architect_id: str, plan_id: Optional[str], interval: int):
             console.print(f"[red]Plan {plan_id} not found[/red]")
             sys.exit(1)
     else:
-        if not arch.plans:
+        plan = storage.load_latest_plan(arch.architect_id)
+        if not plan:
             console.print("[dim]No plans found.[/dim]")
             return
-        plan = arch.plans[-1]
-
-    from beehive.core.session import SessionManager
-    from beehive.core.config import BeehiveConfig
-    from beehive.core.docker_manager import DockerManager
-    from beehive.core.tmux_manager import TmuxManager
 
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
-    session_mgr = ctx.obj.get("session_manager", SessionManager(data_dir))
-    tmux = ctx.obj.get("tmux", TmuxManager())
-    config = ctx.obj.get("config", BeehiveConfig(data_dir))
-    docker_mgr = ctx.obj.get("docker", DockerManager())
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
+    session_mgr, tmux, config, docker_mgr = session_stack(ctx)
 
     last_comment_check = 0.0
+    idle_cycles = 0
+    # The architect's repos don't change while watching
+    repo_paths = {r.name: r.path for r in arch.repos}
+    # ticket_id -> (monotonic time of next PR lookup, current delay)
+    discovery_backoff = {}
+    wake_event, previous_handler = _install_wake_handler()
 
     console.print(f"[bold]Watching plan {plan.plan_id}[/bold] (mode: {plan.execution_mode}, interval: {interval}s)")
+    if wake_event is not None:
+        console.print(f"[dim]Wake early with: kill -USR1 {os.getpid()}[/dim]")
     console.print("Press Ctrl+C to stop.\n")
 
     try:
         while True:
+            # One timestamp for every update made in this cycle
+            cycle_time = datetime.utcnow()
+
             # 0. Auto-complete sessions whose agent process has finished
             session_mgr.auto_complete_sessions()
 
-            # 1. Sync session status → ticket status
-            synced = _sync_tickets_from_sessions(plan, session_mgr)
+            # Bucket tickets by status once; steps 1-2 only move tickets
+            # between the buckets they read, so each re-checks status in place
+            by_status = _tickets_by_status(plan.tickets)
+            active = by_status[TicketStatus.ASSIGNED] + by_status[TicketStatus.IN_PROGRESS]
 
-            # 1b. Discover PR URLs for completed tickets missing them
-            repo_paths = {r.name: r.path for r in arch.repos}
-            for ticket in plan.tickets:
-                if ticket.branch_name and not ticket.pr_url and ticket.status not in (
-                    TicketStatus.PENDING, TicketStatus.FAILED
-                ):
-                    repo_path = repo_paths.get(ticket.repo)
-                    if repo_path:
-                        pr_url = _find_pr_for_branch(ticket.branch_name, repo_path)
-                        if pr_url:
-                            ticket.pr_url = pr_url
-                            ticket.updated_at = datetime.utcnow()
-                            synced = True
-                            console.print(
-                                f"[dim]Discovered PR for {ticket.title}: {pr_url}[/dim]"
-                            )
+            # Messages from steps 1b-2 and 4 are buffered and rendered
+            # with one print each; helpers in between print for themselves
+            msgs = []
+
+            # 1. Sync session status → ticket status
+            synced = _sync_tickets_from_sessions(plan, session_mgr, active, now=cycle_time)
+
+            # 1b. Discover PR URLs for completed tickets missing them.
+            #     PRs are listed once per repo per cycle and shared with step 2;
+            #     the listings (and any per-PR fallbacks) run concurrently.
+            #     Branches that keep coming back without a PR are re-checked
+            #     with exponential backoff.
+            pr_cache = {}
+            now_mono = time.monotonic()
+            discover = [
+                t for t in active + by_status[TicketStatus.COMPLETED] + by_status[TicketStatus.MERGED]
+                if t.branch_name and not t.pr_url and repo_paths.get(t.repo)
+                and t.status not in (TicketStatus.PENDING, TicketStatus.FAILED)
+                and discovery_backoff.get(t.ticket_id, (0.0, 0.0))[0] <= now_mono
+            ]
+            _prefetch_repo_prs(
+                pr_cache, repo_paths,
+                {t.repo for t in discover}
+                | {t.repo for t in active + by_status[TicketStatus.COMPLETED] if t.pr_url},
+            )
+            pr_urls = _discover_pr_urls(discover, pr_cache, repo_paths)
+            for ticket in discover:
+                pr_url = pr_urls.get(ticket.ticket_id)
+                if not pr_url:
+                    delay = _next_discovery_delay(discovery_backoff.get(ticket.ticket_id))
+                    discovery_backoff[ticket.ticket_id] = (now_mono + delay, delay)
+                    continue
+                discovery_backoff.pop(ticket.ticket_id, None)
+                ticket.pr_url = pr_url
+                ticket.updated_at = cycle_time
+                synced = True
+                msgs.append(f"[dim]Discovered PR for {ticket.title}: {pr_url}[/dim]")
 
             # 2. Check for merged/closed PRs
-            for ticket in plan.tickets:
-                if ticket.pr_url and ticket.status in (
+            merge_check = [
+                t for t in active + by_status[TicketStatus.COMPLETED]
+                if t.pr_url and t.status in (
                     TicketStatus.COMPLETED, TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS
+                )
+            ]
+            pr_states = _lookup_pr_states(merge_check, pr_cache, repo_paths)
+            for ticket in merge_check:
+                pr_state = pr_states.get(ticket.pr_url)
+                if pr_state == "MERGED" or (
+                    pr_state == "CLOSED" and ticket.status == TicketStatus.COMPLETED
                 ):
-                    pr_state = _get_pr_state(ticket.pr_url)
-                    if pr_state == "MERGED" or (
-                        pr_state == "CLOSED" and ticket.status == TicketStatus.COMPLETED
-                    ):
-                        ticket.status = TicketStatus.MERGED
-                        ticket.updated_at = datetime.utcnow()
-                        synced = True
-                        console.print(
-                            f"[cyan]✓[/cyan] Ticket [bold]{ticket.title}[/bold] PR merged!"
-                        )
+                    ticket.status = TicketStatus.MERGED
+                    ticket.updated_at = cycle_time
+                    synced = True
+                    msgs.append(f"[cyan]✓[/cyan] Ticket [bold]{ticket.title}[/bold] PR merged!")
 
-            if synced:
-                plan.updated_at = datetime.utcnow()
-                storage.save_plan(arch.architect_id, plan)
+            if msgs:
+                console.print(Group(*msgs))
+                msgs.clear()
 
+            # Ticket changes are saved once per cycle, after the comment check
+            dirty = synced
+            if synced:
                 # 2a. Manage plan-level preview after ticket merges
                 if not plan.preview_url:
                     _maybe_start_plan_preview(plan, arch, storage, data_dir)
@@ -1090,44 +1330,51 @@ def watch_plan(ctx, architect_id: str, plan_id: Optional[str], interval: int):
                     plan, arch, storage, data_dir,
                     session_mgr, tmux, config, docker_mgr,
                 )
-                if comment_changed:
-                    plan.updated_at = datetime.utcnow()
-                    storage.save_plan(arch.architect_id, plan)
+                dirty = dirty or comment_changed
+
+            if dirty:
+                plan.updated_at = cycle_time
+                storage.save_plan(arch.architect_id, plan)
+            activity = dirty
+
+            # Re-bucket: statuses changed above and comment checks may have
+            # queued new feedback tickets
+            by_status = _tickets_by_status(plan.tickets)
 
             # 2c. Assign queued feedback tickets (one per branch, if no in-flight)
-            for ticket in plan.tickets:
-                if ticket.is_feedback and ticket.status == TicketStatus.PENDING:
-                    in_flight_on_branch = any(
-                        t.is_feedback
-                        and t.status in (TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS)
-                        and t.branch_name == ticket.branch_name
-                        for t in plan.tickets
+            busy_branches = {
+                t.branch_name
+                for t in by_status[TicketStatus.ASSIGNED] + by_status[TicketStatus.IN_PROGRESS]
+                if t.is_feedback
+            }
+            for ticket in by_status[TicketStatus.PENDING]:
+                if ticket.is_feedback and ticket.branch_name not in busy_branches:
+                    console.print(
+                        f"[bold]Dispatching queued feedback:[/bold] {ticket.title}"
                     )
-                    if not in_flight_on_branch:
-                        console.print(
-                            f"[bold]Dispatching queued feedback:[/bold] {ticket.title}"
-                        )
-                        _assign_feedback_ticket(
-                            ticket, plan, arch, storage, data_dir,
-                            session_mgr, tmux, config, docker_mgr,
-                        )
+                    _assign_feedback_ticket(
+                        ticket, plan, arch, storage, data_dir,
+                        session_mgr, tmux, config, docker_mgr,
+                    )
+                    activity = True
+                    if ticket.status in (TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS):
+                        busy_branches.add(ticket.branch_name)
 
             # 3. In sequential mode: auto-assign next ticket if none in-flight
             #    (exclude feedback tickets from in-flight and pending checks)
             if plan.execution_mode == "sequential":
-                in_flight = [
-                    t for t in plan.tickets
-                    if not t.is_feedback
-                    and t.status in (TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS, TicketStatus.COMPLETED)
-                ]
+                in_flight = any(
+                    not t.is_feedback
+                    for status in (TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS, TicketStatus.COMPLETED)
+                    for t in by_status[status]
+                )
                 if not in_flight:
-                    pending = sorted(
-                        [t for t in plan.tickets
-                         if not t.is_feedback and t.status == TicketStatus.PENDING],
-                        key=lambda t: t.order,
+                    next_ticket = next(
+                        (t for t in plan.sorted_tickets
+                         if not t.is_feedback and t.status == TicketStatus.PENDING),
+                        None,
                     )
-                    if pending:
-                        next_ticket = pending[0]
+                    if next_ticket:
                         console.print(
                             f"\n[bold]Auto-assigning next ticket:[/bold] #{next_ticket.order} {next_ticket.title}"
                         )
@@ -1136,11 +1383,11 @@ def watch_plan(ctx, architect_id: str, plan_id: Optional[str], interval: int):
                             session_mgr, tmux, config, docker_mgr,
                             True, False,
                         )
+                        activity = True
 
             # 4. Check if all non-feedback tickets are terminal
-            terminal_statuses = {TicketStatus.MERGED, TicketStatus.FAILED}
             non_feedback = [t for t in plan.tickets if not t.is_feedback]
-            all_terminal = all(t.status in terminal_statuses for t in non_feedback) if non_feedback else False
+            all_terminal = all(t.status in _TERMINAL_STATUSES for t in non_feedback) if non_feedback else False
 
             if all_terminal:
                 if not plan.feature_pr_url:
@@ -1153,35 +1400,109 @@ def watch_plan(ctx, architect_id: str, plan_id: Optional[str], interval: int):
                     if pr_state == "MERGED":
                         # Tear down preview and exit
                         _stop_plan_preview(plan, data_dir)
-                        plan.updated_at = datetime.utcnow()
+                        plan.updated_at = cycle_time
                         storage.save_plan(arch.architect_id, plan)
                         console.print("\n[green bold]Feature branch PR merged! Plan complete.[/green bold]")
                         _print_tickets_table(plan.tickets)
                         break
                     else:
-                        console.print(f"[dim]Feature PR open: {plan.feature_pr_url} — waiting for merge...[/dim]")
+                        msgs.append(f"[dim]Feature PR open: {plan.feature_pr_url} — waiting for merge...[/dim]")
 
             # Show brief status
-            counts = {}
-            for t in plan.tickets:
-                counts[t.status] = counts.get(t.status, 0) + 1
+            counts = Counter(t.status for t in plan.tickets)
             parts = [f"{v} {k}" for k, v in counts.items()]
-            console.print(f"[dim]{', '.join(parts)}[/dim]")
+            msgs.append(f"[dim]{', '.join(parts)}[/dim]")
+            console.print(Group(*msgs))
 
-            time.sleep(interval)
+            # Poll at the base interval while any ticket is in flight or
+            # something changed; back off (capped) only when nothing is running
+            in_flight = counts[TicketStatus.ASSIGNED] + counts[TicketStatus.IN_PROGRESS]
+            idle_cycles = 0 if activity or in_flight else min(idle_cycles + 1, 2)
+            if _wait_for_wake(_next_poll_interval(interval, idle_cycles), wake_event):
+                idle_cycles = 0
 
     except KeyboardInterrupt:
         console.print("\n[dim]Watch stopped.[/dim]")
         _print_tickets_table(plan.tickets)
+    finally:
+        if wake_event is not None:
+            signal.signal(signal.SIGUSR1, previous_handler)
+
+
+def _next_discovery_delay(backoff: Optional[tuple[float, float]]) -> float:
+    """Seconds until a branch with no PR is looked up again: 5, 10, 20... capped at 120."""
+    if backoff is None:
+        return 5.0
+    return min(backoff[1] * 2, 120.0)
+
+
+def _next_poll_interval(interval: int, idle_cycles: int) -> int:
+    """Polling delay after N quiet cycles: interval, 2x, then capped at 4x.
+
+    Callers keep idle_cycles clamped, so the power stays small.
+    """
+    return interval * min(2 ** idle_cycles, 4)
+
+
+def _install_wake_handler():
+    """Route SIGUSR1 to a threading.Event that _wait_for_wake sleeps on.
+
+    Returns (event, previous handler), or (None, None) where a handler
+    can't be installed (no SIGUSR1, or not on the main thread), in which
+    case the watcher falls back to plain sleeps. The signal is never
+    blocked, so subprocesses started while watching inherit a normal mask.
+    """
+    if not hasattr(signal, "SIGUSR1"):
+        return None, None
+    event = threading.Event()
+    try:
+        previous = signal.signal(signal.SIGUSR1, lambda signum, frame: event.set())
+    except ValueError:
+        return None, None
+    return event, previous
+
+
+def _wait_for_wake(timeout: float, wake_event: Optional[threading.Event]) -> bool:
+    """Sleep up to ``timeout`` seconds. Returns True if woken early by SIGUSR1."""
+    if wake_event is None:
+        time.sleep(timeout)
+        return False
+    woken = wake_event.wait(timeout)
+    wake_event.clear()
+    return woken
+
+
+# projects.json path -> ((mtime_ns, size), {architect_id: Project})
+_ARCHITECT_PROJECT_INDEX: dict[Path, tuple[tuple[int, int], dict]] = {}
 
 
 def _find_project_for_architect(architect_id: str, data_dir: Path):
-    """Scan all projects for one that has this architect linked."""
-    project_storage = ProjectStorage(data_dir)
-    for proj in project_storage.load_all_projects():
-        if architect_id in proj.architect_ids:
-            return proj
-    return None
+    """Find the project that has this architect linked.
+
+    The architect → project index is built from a single scan of all
+    projects and reused until projects.json changes on disk.
+    """
+    from beehive.core.project_storage import ProjectStorage
+
+    projects_file = Path(data_dir) / "projects" / "projects.json"
+    try:
+        st = projects_file.stat()
+    except FileNotFoundError:
+        # No projects have ever been created, so nothing can be linked
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+
+    cached = _ARCHITECT_PROJECT_INDEX.get(projects_file)
+    if not cached or cached[0] != key:
+        index = {}
+        for proj in ProjectStorage(data_dir).load_all_projects():
+            for aid in proj.architect_ids:
+                # First project wins, matching the old linear scan
+                index.setdefault(aid, proj)
+        _ARCHITECT_PROJECT_INDEX[projects_file] = (key, index)
+    else:
+        index = cached[1]
+    return index.get(architect_id)
 
 
 def _stop_plan_preview(plan, data_dir: Path) -> None:
@@ -1209,9 +1530,8 @@ def _create_feature_pr_and_preview(plan, arch, storage, data_dir: Path) -> None:
     project = _find_project_for_architect(arch.architect_id, data_dir)
 
     # Build ticket summary table for PR body
-    sorted_tickets = sorted(plan.tickets, key=lambda t: t.order)
     ticket_rows = []
-    for t in sorted_tickets:
+    for t in plan.sorted_tickets:
         pr_link = f"[{t.pr_url.split('/')[-1]}]({t.pr_url})" if t.pr_url else "—"
         ticket_rows.append(f"| {t.order} | {t.title} | {t.status} | {pr_link} |")
     ticket_table = "\n".join(ticket_rows)
@@ -1222,7 +1542,7 @@ def _create_feature_pr_and_preview(plan, arch, storage, data_dir: Path) -> None:
         seen_repos.add(ticket.repo)
 
     for repo_name in seen_repos:
-        repo_config = next((r for r in arch.repos if r.name == repo_name), None)
+        repo_config = arch.get_repo(repo_name)
         if not repo_config:
             continue
 
@@ -1326,6 +1646,8 @@ def _create_feature_pr_and_preview(plan, arch, storage, data_dir: Path) -> None:
 
 def _print_tickets_table(tickets):
     """Print a Rich table of tickets."""
+    from rich.table import Table
+
     table = Table()
     table.add_column("#", style="dim")
     table.add_column("ID", style="cyan")
@@ -1336,27 +1658,30 @@ def _print_tickets_table(tickets):
     table.add_column("Session", style="dim")
     table.add_column("PR", style="dim")
 
-    status_colors = {
-        "pending": "yellow",
-        "assigned": "blue",
-        "in_progress": "green",
-        "completed": "green",
-        "failed": "red",
-        "merged": "cyan",
-    }
+    for row in _ticket_rows(tickets):
+        table.add_row(*row)
 
-    sorted_tickets = sorted(tickets, key=lambda t: t.order)
-    for t in sorted_tickets:
-        color = status_colors.get(t.status, "white")
-        table.add_row(
+    console.print(table)
+
+
+def _ticket_rows(tickets) -> list[tuple]:
+    """Project tickets into ticket-table cells, in execution order."""
+    return [
+        (
             str(t.order) if t.order else "—",
             t.ticket_id,
             t.title,
             t.repo,
-            f"[{color}]{t.status}[/{color}]",
+            _status_cell(t.status),
             t.branch_name or "",
             t.session_id or "",
             t.pr_url or "",
         )
+        for t in sorted(tickets, key=attrgetter("order"))
+    ]
 
-    console.print(table)
+
+@lru_cache(maxsize=16)
+def _status_cell(status: str) -> Text:
+    """Styled status cell, shared across rows (rendering doesn't mutate Text)."""
+    return Text(status, style=_TICKET_STATUS_STYLE.get(status, "white"))
@@ -0,0 +1,95 @@
+"""Helpers shared by the architect, researcher and project CLI groups."""
+
+import threading
+
+from rich.console import Console
+
+from beehive.utils.config import Config
+
+console = Console()
+
+# Held around mutations/saves of the plan or study being assigned, and
+# around image builds, while items are assigned from worker threads
+assign_lock = threading.Lock()
+image_lock = threading.Lock()
+
+# Batch assignment saves once at the end, plus every N items so a crash
+# mid-batch doesn't lose track of sessions already started
+ASSIGN_CHECKPOINT_EVERY = 10
+
+
+def ctx_service(ctx, key: str):
+    """Return a manager from ctx.obj, building and caching it there if absent.
+
+    The root CLI supplies these lazily; this covers a command group being
+    invoked on its own, without constructing anything that is already
+    provided.
+    """
+    if key not in ctx.obj:
+        data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
+        if key == "session_manager":
+            from beehive.core.session import SessionManager
+
+            ctx.obj[key] = SessionManager(data_dir)
+        elif key == "tmux":
+            from beehive.core.tmux_manager import TmuxManager
+
+            ctx.obj[key] = TmuxManager()
+        elif key == "config":
+            from beehive.core.config import BeehiveConfig
+
+            ctx.obj[key] = BeehiveConfig(data_dir)
+        elif key == "docker":
+            from beehive.core.docker_manager import DockerManager
+
+            ctx.obj[key] = DockerManager()
+        else:
+            raise KeyError(key)
+    return ctx.obj[key]
+
+
+def session_stack(ctx) -> tuple:
+    """Return (session_manager, tmux, config, docker) for commands that launch agents."""
+    return tuple(ctx_service(ctx, key) for key in ("session_manager", "tmux", "config", "docker"))
+
+
+def run_assign_batch(items, assign_one, save, noun: str, parallel: bool = False) -> list:
+    """Assign each item with ``assign_one(item) -> session_id | None``.
+
+    ``save()`` persists the shared plan/study; it is called under
+    ``assign_lock`` every ASSIGN_CHECKPOINT_EVERY items and once at the
+    end, even if the batch is interrupted. With ``parallel`` and more than
+    one item the assignments run on a thread pool and a tally is printed,
+    since the per-item lines interleave. Returns the session IDs in item
+    order.
+    """
+    done = 0
+
+    def assign(item):
+        nonlocal done
+        session_id = assign_one(item)
+        with assign_lock:
+            done += 1
+            if done % ASSIGN_CHECKPOINT_EVERY == 0:
+                save()
+        return session_id
+
+    try:
+        if not parallel or len(items) == 1:
+            return [assign(item) for item in items]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Each assignment is mostly waiting on git/docker/tmux subprocesses
+        with ThreadPoolExecutor(max_workers=min(len(items), 8)) as pool:
+            session_ids = [*pool.map(assign, items)]
+    finally:
+        with assign_lock:
+            save()
+
+    failed = [item.title for item, sid in zip(items, session_ids) if not sid]
+    console.print(
+        f"\nAssigned {len(session_ids) - len(failed)}/{len(session_ids)} {noun}"
+        + (f" [red](failed: {', '.join(failed)})[/red]" if failed else "")
+    )
+    return session_ids
@@ -1,31 +1,58 @@
 """CLI commands for the Project and CTO features."""
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import click
-import yaml
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.table import Table
 
-from beehive.core.architect import ArchitectRepo
-from beehive.core.architect_storage import ArchitectStorage
-from beehive.core.preview import PreviewManager
-from beehive.core.project import PreviewConfig, Project
-from beehive.core.project_storage import ProjectStorage
-from beehive.core.session import SessionManager
+from beehive.utils.config import Config
+from beehive.utils.yaml_cache import load_yaml_config
 
 console = Console()
 
 
-def _get_storage(ctx) -> tuple[ProjectStorage, ArchitectStorage, SessionManager]:
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
-    project_storage = ProjectStorage(data_dir)
-    architect_storage = ArchitectStorage(data_dir)
-    session_manager = ctx.obj.get("session_manager", SessionManager(data_dir))
-    return project_storage, architect_storage, session_manager
+def _get_storage(ctx) -> tuple:
+    """Return (ProjectStorage, ArchitectStorage, SessionManager) for the data dir.
+
+    Each is built at most once per invocation and kept on ctx.obj, under
+    the same keys the root CLI and the architect group use.
+    """
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
+    if "project_storage" not in ctx.obj:
+        from beehive.core.project_storage import ProjectStorage
+
+        ctx.obj["project_storage"] = ProjectStorage(data_dir)
+    if "architect_storage" not in ctx.obj:
+        from beehive.core.architect_storage import ArchitectStorage
+
+        ctx.obj["architect_storage"] = ArchitectStorage(data_dir)
+    if "session_manager" not in ctx.obj:
+        from beehive.core.session import SessionManager
+
+        ctx.obj["session_manager"] = SessionManager(data_dir)
+    return ctx.obj["project_storage"], ctx.obj["architect_storage"], ctx.obj["session_manager"]
+
+
+# Replies longer than this are usually pasted logs; show them as plain text
+_MARKDOWN_MAX_CHARS = 16 * 1024
+
+
+@lru_cache(maxsize=64)
+def _markdown(text: str):
+    """Parse text into a rich Markdown renderable, reusing recent parses."""
+    if len(text) > _MARKDOWN_MAX_CHARS:
+        from rich.text import Text
+
+        return Text(text)
+
+    from rich.markdown import Markdown
+
+    return Markdown(text)
 
 
 # ─── Project commands ────────────────────────────────────────────────────────
@@ -51,6 +78,9 @@ def project(ctx):
 @click.pass_context
 def project_create(ctx, name: str, config_file: Optional[Path], description: str):
     """Create a new project."""
+    from beehive.core.architect import ArchitectRepo
+    from beehive.core.project import PreviewConfig, Project
+
     project_storage, _, _ = _get_storage(ctx)
 
     proj_data = {
@@ -59,8 +89,8 @@ def project_create(ctx, name: str, config_file: Optional[Path], description: str
     }
 
     if config_file:
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+        data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
+        config = load_yaml_config(config_file, data_dir / ".yaml-cache")
 
         if config.get("description"):
             proj_data["description"] = config["description"]
@@ -69,19 +99,27 @@ def project_create(ctx, name: str, config_file: Optional[Path], description: str
         if config.get("engineering_principles"):
             proj_data["engineering_principles"] = config["engineering_principles"]
 
-        repos = []
-        for repo_data in config.get("repos", []):
-            repo_path = Path(repo_data["path"])
-            if not repo_path.exists():
-                console.print(f"[yellow]Warning: repo path does not exist: {repo_path}[/yellow]")
-            repos.append(
-                ArchitectRepo(
-                    name=repo_data["name"],
-                    path=str(repo_path),
-                    base_branch=repo_data.get("base_branch", "main"),
-                    description=repo_data.get("description", ""),
-                )
+        repos = [
+            ArchitectRepo(
+                name=repo_data["name"],
+                path=str(Path(repo_data["path"])),
+                base_branch=repo_data.get("base_branch", "main"),
+                description=repo_data.get("description", ""),
             )
+            for repo_data in config.get("repos", [])
+        ]
+        repo_paths = [Path(r.path) for r in repos]
+        if len(repo_paths) > 1:
+            # stat() can block for a while on network mounts; check paths concurrently
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(len(repo_paths), 8)) as pool:
+                exists = [*pool.map(os.path.lexists, repo_paths)]
+        else:
+            exists = [os.path.lexists(p) for p in repo_paths]
+        for repo_path, found in zip(repo_paths, exists):
+            if not found:
+                console.print(f"[yellow]Warning: repo path does not exist: {repo_path}[/yellow]")
         proj_data["repos"] = repos
 
         if config.get("preview"):
@@ -115,18 +153,25 @@ def project_list(ctx):
     table.add_column("Architects")
     table.add_column("Created")
 
-    for p in projects:
-        repo_names = ", ".join(r.name for r in p.repos) if p.repos else "—"
-        table.add_row(
+    for row in _project_rows(projects):
+        table.add_row(*row)
+
+    console.print(table)
+
+
+def _project_rows(projects) -> list[tuple]:
+    """Project projects into plain-string cells for the projects table."""
+    return [
+        (
             p.project_id,
             p.name,
             (p.description[:40] + "...") if len(p.description) > 40 else p.description or "—",
-            repo_names,
+            ", ".join(r.name for r in p.repos) if p.repos else "—",
             str(len(p.architect_ids)),
-            p.created_at.strftime("%Y-%m-%d %H:%M"),
+            p.created_at.isoformat(" ", "minutes"),
         )
-
-    console.print(table)
+        for p in projects
+    ]
 
 
 @project.command("show")
@@ -143,7 +188,7 @@ def project_show(ctx, project_id: str):
 
     console.print(f"\n[bold]Project: {proj.name}[/bold]")
     console.print(f"  ID: [cyan]{proj.project_id}[/cyan]")
-    console.print(f"  Created: {proj.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    console.print(f"  Created: {proj.created_at.isoformat(' ', 'seconds')}")
     if proj.description:
         console.print(f"  Description: {proj.description}")
 
@@ -173,8 +218,9 @@ def project_show(ctx, project_id: str):
 
     console.print(f"\n[bold]Linked Architects:[/bold]")
     if proj.architect_ids:
+        architects = architect_storage.load_many(proj.architect_ids)
         for arch_id in proj.architect_ids:
-            arch = architect_storage.load_architect(arch_id)
+            arch = architects.get(arch_id)
             if arch:
                 console.print(f"  [cyan]{arch.architect_id}[/cyan]: {arch.name}")
             else:
@@ -219,7 +265,7 @@ def project_link(ctx, project_id: str, architect_id: str):
         console.print(f"[red]Project {project_id} not found[/red]")
         sys.exit(1)
 
-    arch = architect_storage.load_architect(architect_id)
+    arch = architect_storage.load_architect_meta(architect_id)
     if not arch:
         console.print(f"[red]Architect {architect_id} not found[/red]")
         sys.exit(1)
@@ -229,7 +275,7 @@ def project_link(ctx, project_id: str, architect_id: str):
         return
 
     proj.architect_ids.append(arch.architect_id)
-    project_storage.save_project(proj)
+    project_storage.update_fields(proj.project_id, architect_ids=proj.architect_ids)
     console.print(
         f"[green]✓[/green] Linked architect [bold]{arch.name}[/bold] "
         f"to project [bold]{proj.name}[/bold]"
@@ -250,7 +296,7 @@ def project_unlink(ctx, project_id: str, architect_id: str):
         sys.exit(1)
 
     # Find the full ID (support partial match)
-    arch = architect_storage.load_architect(architect_id)
+    arch = architect_storage.load_architect_meta(architect_id)
     if not arch:
         console.print(f"[red]Architect {architect_id} not found[/red]")
         sys.exit(1)
@@ -260,7 +306,7 @@ def project_unlink(ctx, project_id: str, architect_id: str):
         return
 
     proj.architect_ids.remove(arch.architect_id)
-    project_storage.save_project(proj)
+    project_storage.update_fields(proj.project_id, architect_ids=proj.architect_ids)
     console.print(
         f"[green]✓[/green] Unlinked architect [bold]{arch.name}[/bold] "
         f"from project [bold]{proj.name}[/bold]"
@@ -327,7 +373,6 @@ def project_claude_md_set(ctx, project_id: str, content: str):
 @click.pass_context
 def project_claude_md_edit(ctx, project_id: str):
     """Edit the project CLAUDE.md in $EDITOR."""
-    import os
     import subprocess
 
     project_storage, _, _ = _get_storage(ctx)
@@ -361,15 +406,16 @@ def preview_group(ctx):
 @click.pass_context
 def preview_list(ctx):
     """List active preview environments."""
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
+    from beehive.core.preview import PreviewManager
+
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
     preview_mgr = PreviewManager(data_dir)
 
-    # Clean up dead previews first
-    cleaned = preview_mgr.cleanup_dead_previews()
+    # Dead previews are dropped in the same pass
+    previews, cleaned = preview_mgr.list_previews_with_cleanup()
     if cleaned:
         console.print(f"[dim]Cleaned up {cleaned} dead preview(s).[/dim]")
 
-    previews = preview_mgr.list_previews()
     if not previews:
         console.print("[dim]No active previews.[/dim]")
         return
@@ -379,17 +425,14 @@ def preview_list(ctx):
     table.add_column("Port")
     table.add_column("URL")
     table.add_column("PID")
-    table.add_column("Alive")
 
+    # Only live previews are listed; dead ones were dropped by the cleanup pass
     for p in previews:
-        alive = PreviewManager._is_process_alive(p.pid)
-        alive_display = "[green]yes[/green]" if alive else "[red]no[/red]"
         table.add_row(
             p.session_id,
             str(p.port),
             p.url,
             str(p.pid),
-            alive_display,
         )
 
     console.print(table)
@@ -400,7 +443,9 @@ def preview_list(ctx):
 @click.pass_context
 def preview_stop(ctx, session_id: str):
     """Stop a specific preview environment."""
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
+    from beehive.core.preview import PreviewManager
+
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
     preview_mgr = PreviewManager(data_dir)
 
     if preview_mgr.stop_preview(session_id):
@@ -413,21 +458,20 @@ def preview_stop(ctx, session_id: str):
 @click.pass_context
 def preview_stop_all(ctx):
     """Stop all active preview environments."""
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
+    from beehive.core.preview import PreviewManager
+
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
     preview_mgr = PreviewManager(data_dir)
 
-    previews = preview_mgr.list_previews()
-    if not previews:
+    stopped = preview_mgr.stop_all_previews()
+    if not stopped:
         console.print("[dim]No active previews.[/dim]")
         return
 
-    stopped = 0
-    for p in previews:
-        if preview_mgr.stop_preview(p.session_id):
-            stopped += 1
-            console.print(f"  Stopped preview for session [cyan]{p.session_id}[/cyan]")
+    for session_id in stopped:
+        console.print(f"  Stopped preview for session [cyan]{session_id}[/cyan]")
 
-    console.print(f"[green]✓[/green] Stopped {stopped} preview(s)")
+    console.print(f"[green]✓[/green] Stopped {len(stopped)} preview(s)")
 
 
 # ─── CTO commands ────────────────────────────────────────────────────────────
@@ -464,9 +508,19 @@ def cto_chat(ctx, project_id: str, clear: bool):
     console.print(f"[bold]CTO Chat — {proj.name}[/bold]")
     console.print("[dim]Type 'exit' or 'quit' to end. Ctrl+C to abort.[/dim]\n")
 
+    # Piped/scripted input gets plain line reads and no spinner thread
+    interactive = sys.stdin.isatty()
+
     while True:
         try:
-            user_input = console.input("[bold #FFD700]You:[/bold #FFD700] ")
+            if interactive:
+                user_input = console.input("[bold #FFD700]You:[/bold #FFD700] ")
+            else:
+                line = sys.stdin.readline()
+                if not line:
+                    raise EOFError
+                # console.input never included the newline; keep it out of history
+                user_input = line.rstrip("\n")
         except (EOFError, KeyboardInterrupt):
             console.print("\n[dim]Chat ended.[/dim]")
             break
@@ -479,10 +533,13 @@ def cto_chat(ctx, project_id: str, clear: bool):
             continue
 
         try:
-            with console.status("[bold green]Thinking..."):
+            if interactive:
+                with console.status("[bold green]Thinking..."):
+                    response = cto_ai.chat(user_input)
+            else:
                 response = cto_ai.chat(user_input)
             console.print()
-            console.print(Markdown(response))
+            console.print(_markdown(response))
             console.print()
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
@@ -517,7 +574,7 @@ def cto_brief(ctx, project_id: str, raw_only: bool):
         console.print("[bold]── Raw Status ──[/bold]\n")
         console.print(raw_data)
         console.print("\n[bold]── Strategic Summary ──[/bold]\n")
-        console.print(Markdown(ai_summary))
+        console.print(_markdown(ai_summary))
     except Exception as e:
         console.print(f"[red]Error generating brief: {e}[/red]")
         sys.exit(1)
@@ -536,15 +593,14 @@ def cto_history(ctx, project_id: str, last: int):
         console.print(f"[red]Project {project_id} not found[/red]")
         sys.exit(1)
 
-    conv = project_storage.load_conversation(proj.project_id)
+    messages, total = project_storage.load_conversation_tail(proj.project_id, last)
 
-    if not conv.messages:
+    if not total:
         console.print("[dim]No conversation history.[/dim]")
         return
 
-    messages = conv.messages[-last:]
     console.print(f"[bold]CTO Conversation — {proj.name}[/bold]")
-    console.print(f"[dim]Showing last {len(messages)} of {len(conv.messages)} messages[/dim]\n")
+    console.print(f"[dim]Showing last {len(messages)} of {total} messages[/dim]\n")
 
     for msg in messages:
         ts = msg.timestamp.strftime("%m/%d %H:%M")
@@ -552,7 +608,7 @@ def cto_history(ctx, project_id: str, last: int):
             console.print(f"[dim]{ts}[/dim] [bold #FFD700]You:[/bold #FFD700] {msg.content}")
         else:
             console.print(f"[dim]{ts}[/dim] [bold cyan]CTO:[/bold cyan]")
-            console.print(Markdown(msg.content))
+            console.print(_markdown(msg.content))
         console.print()
 
 
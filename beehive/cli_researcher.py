@@ -1,20 +1,20 @@
 """CLI commands for the Researcher feature."""
 
-import subprocess
+import functools
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import click
-import yaml
 from rich.console import Console
-from rich.table import Table
 
+from beehive.cli_common import assign_lock, ctx_service, image_lock, run_assign_batch, session_stack
 from beehive.core.architect import ArchitectRepo
-from beehive.core.project_storage import ProjectStorage
 from beehive.core.researcher import ExperimentStatus, Researcher
-from beehive.core.researcher_storage import ResearcherStorage
+from beehive.utils.config import Config
+from beehive.utils.yaml_cache import load_yaml_config
 
 console = Console()
 
@@ -23,8 +23,10 @@ console = Console()
 @click.pass_context
 def researcher(ctx):
     """Manage researchers, studies, and experiments."""
+    from beehive.core.researcher_storage import ResearcherStorage
+
     ctx.ensure_object(dict)
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
     ctx.obj["researcher_storage"] = ResearcherStorage(data_dir)
 
 
@@ -39,6 +41,8 @@ def list_researchers(ctx):
         console.print("[dim]No researchers found.[/dim]")
         return
 
+    from rich.table import Table
+
     table = Table(title="Researchers")
     table.add_column("ID", style="cyan")
     table.add_column("Name")
@@ -69,14 +73,15 @@ def list_researchers(ctx):
     type=click.Path(exists=True, path_type=Path),
     help="YAML config file for the researcher",
 )
+@click.option("--no-cache", is_flag=True, help="Always re-parse the config file")
 @click.pass_context
-def create_researcher(ctx, name: str, config_file: Path):
+def create_researcher(ctx, name: str, config_file: Path, no_cache: bool):
     """Create a new researcher from a YAML config file."""
     storage = ctx.obj["researcher_storage"]
 
-    # Parse YAML
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
+    # Parse YAML (reused from the cache while the file is unchanged)
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
+    config = load_yaml_config(config_file, None if no_cache else data_dir / ".yaml-cache")
 
     # Build repos
     repos = []
@@ -233,8 +238,7 @@ def edit_experiment(ctx, experiment_id: str, title: Optional[str], description:
             sys.exit(1)
         experiment.repo = repo
 
-    experiment.updated_at = datetime.utcnow()
-    study.updated_at = datetime.utcnow()
+    experiment.updated_at = study.updated_at = datetime.utcnow()
     storage.save_study(res.researcher_id, study)
 
     console.print(f"[green]\u2713[/green] Updated experiment [cyan]{experiment.experiment_id}[/cyan]")
@@ -246,9 +250,13 @@ def edit_experiment(ctx, experiment_id: str, title: Optional[str], description:
 @click.option("--all", "-a", "assign_all", is_flag=True, default=True, help="Assign all pending experiments (default)")
 @click.option("--no-auto-approve", is_flag=True, help="Disable auto-approve (-y)")
 @click.option("--no-docker", is_flag=True, help="Force host execution")
+@click.option("--parallel", is_flag=True, default=False, help="Set up all experiments concurrently")
 @click.pass_context
-def assign_experiments(ctx, researcher_id: str, experiment_id: Optional[str], assign_all: bool, no_auto_approve: bool, no_docker: bool):
-    """Assign experiments to beehive agent sessions."""
+def assign_experiments(ctx, researcher_id: str, experiment_id: Optional[str], assign_all: bool, no_auto_approve: bool, no_docker: bool, parallel: bool):
+    """Assign experiments to beehive agent sessions.
+
+    Experiments are set up one at a time unless --parallel is given.
+    """
     storage = ctx.obj["researcher_storage"]
     res = storage.load_researcher(researcher_id)
 
@@ -281,151 +289,168 @@ def assign_experiments(ctx, researcher_id: str, experiment_id: Optional[str], as
 
     auto_approve = not no_auto_approve
 
-    # Import session management
-    from beehive.core.session import SessionManager
-    from beehive.core.git_ops import GitOperations
-    from beehive.core.tmux_manager import TmuxManager
-    from beehive.core.config import BeehiveConfig
-    from beehive.core.docker_manager import DockerManager
-
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
-    session_mgr = ctx.obj.get("session_manager", SessionManager(data_dir))
-    tmux = ctx.obj.get("tmux", TmuxManager())
-    config = ctx.obj.get("config", BeehiveConfig(data_dir))
-    docker_mgr = ctx.obj.get("docker", DockerManager())
+    # Only built once there is something to assign
+    data_dir = ctx.obj.get("data_dir", Config.DEFAULT_DATA_DIR)
+    session_mgr, tmux, config, docker_mgr = session_stack(ctx)
 
     if not tmux.check_tmux_installed():
         console.print("[red]Error: tmux not found.[/red]")
         sys.exit(1)
 
-    for experiment in experiments_to_assign:
-        # Find repo config
-        repo_config = next((r for r in res.repos if r.name == experiment.repo), None)
-        if not repo_config:
-            console.print(f"[red]Repo '{experiment.repo}' not found in researcher config[/red]")
-            continue
+    use_docker = auto_approve and not no_docker and docker_mgr.is_available()
+
+    # The linked project can't change mid-batch; look it up on first use only
+    # (a failed lookup isn't cached, so the next experiment retries it)
+    linked_project = functools.cache(lambda: _find_project_for_researcher(res, data_dir))
+
+    run_assign_batch(
+        experiments_to_assign,
+        lambda experiment: _assign_single_experiment(
+            experiment, study, res, storage, data_dir,
+            session_mgr, tmux, config, docker_mgr,
+            auto_approve, use_docker, linked_project, save=False,
+        ),
+        lambda: storage.save_study(res.researcher_id, study),
+        "experiments",
+        parallel=parallel,
+    )
 
-        repo_path = Path(repo_config.path)
-        git = GitOperations(repo_path)
-        if not git.is_git_repo():
-            console.print(f"[red]Error: {repo_path} is not a git repository[/red]")
-            continue
 
-        try:
-            # Determine whether to use Docker
-            use_docker = auto_approve and not no_docker and docker_mgr.is_available()
+def _assign_single_experiment(experiment, study, res, storage, data_dir: Path,
+                              session_mgr, tmux, config, docker_mgr,
+                              auto_approve: bool, use_docker: bool, linked_project,
+                              save: bool = True) -> Optional[str]:
+    """Assign one experiment to a new beehive session. Returns session_id or None.
 
-            # Combine instructions with global prompt (research deliverable)
-            instructions = config.combine_research_prompts(
-                experiment.description,
-                include_deliverable=auto_approve,
-            )
+    Safe to call from worker threads: study mutations and saves happen
+    under ``assign_lock`` and image builds under ``image_lock``. With
+    ``save=False`` the study is updated in memory only and the caller is
+    responsible for saving it.
+    """
+    from beehive.core.git_ops import GitOperations, get_git_identity
+    from beehive.core.tmux_manager import TmuxManager
+
+    # Find repo config
+    repo_config = res.get_repo(experiment.repo)
+    if not repo_config:
+        console.print(f"[red]Repo '{experiment.repo}' not found in researcher config[/red]")
+        return None
 
-            # Create session
-            session = session_mgr.create_session(
-                name=experiment.title,
-                instructions=instructions,
-                working_dir=repo_path,
-                base_branch=repo_config.base_branch,
-                use_docker=use_docker,
+    repo_path = Path(repo_config.path)
+    git = GitOperations(repo_path)
+    if not git.is_git_repo():
+        console.print(f"[red]Error: {repo_path} is not a git repository[/red]")
+        return None
+
+    try:
+        # Combine instructions with global prompt (research deliverable)
+        instructions = config.combine_research_prompts(
+            experiment.description,
+            include_deliverable=auto_approve,
+        )
+
+        # Create session
+        session = session_mgr.create_session(
+            name=experiment.title,
+            instructions=instructions,
+            working_dir=repo_path,
+            base_branch=repo_config.base_branch,
+            use_docker=use_docker,
+        )
+
+        # Create isolated workspace
+        worktree_path = Path(session.working_directory)
+        if use_docker:
+            git.clone_for_docker(session.branch_name, worktree_path, repo_config.base_branch)
+        else:
+            git.create_worktree(session.branch_name, worktree_path, repo_config.base_branch)
+
+        # Inject CLAUDE.md
+        config.inject_claude_md(worktree_path)
+
+        # Write prompt files
+        (worktree_path / ".beehive-system-prompt.txt").write_text(instructions)
+
+        # Prepare Docker gitconfig
+        if use_docker:
+            git_name, git_email = get_git_identity(repo_path)
+            (worktree_path / ".beehive-gitconfig").write_text(
+                f"[user]\n\tname = {git_name}\n\temail = {git_email}\n"
             )
 
-            # Create isolated workspace
-            worktree_path = Path(session.working_directory)
-            if use_docker:
-                git.clone_for_docker(session.branch_name, worktree_path, repo_config.base_branch)
+        # Build docker command if using Docker
+        docker_command = None
+        if use_docker:
+            with image_lock:
+                image_ok = docker_mgr.ensure_image()
+            if not image_ok:
+                console.print(f"[yellow]Warning: Docker image build failed, falling back to host for {experiment.title}[/yellow]")
+                use_docker = False
+                session_mgr.update_session(
+                    session.session_id,
+                    container_name=None,
+                    runtime="host",
+                )
             else:
-                git.create_worktree(session.branch_name, worktree_path, repo_config.base_branch)
-
-            # Inject CLAUDE.md
-            config.inject_claude_md(worktree_path)
-
-            # Write prompt files
-            (worktree_path / ".beehive-system-prompt.txt").write_text(instructions)
-
-            # Prepare Docker gitconfig
-            if use_docker:
-                git_name = subprocess.run(
-                    ["git", "config", "user.name"],
-                    capture_output=True, text=True,
-                ).stdout.strip() or "Beehive Agent"
-                git_email = subprocess.run(
-                    ["git", "config", "user.email"],
-                    capture_output=True, text=True,
-                ).stdout.strip() or "agent@beehive"
-                (worktree_path / ".beehive-gitconfig").write_text(
-                    f"[user]\n\tname = {git_name}\n\temail = {git_email}\n"
+                claude_cmd = TmuxManager._build_claude_command(
+                    "/workspace",
+                    has_initial_prompt=False,
+                    auto_approve=auto_approve,
+                )
+                docker_command = docker_mgr.build_run_command(
+                    session.session_id, worktree_path, claude_cmd
                 )
 
-            # Build docker command if using Docker
-            docker_command = None
-            if use_docker:
-                if not docker_mgr.ensure_image():
-                    console.print(f"[yellow]Warning: Docker image build failed, falling back to host for {experiment.title}[/yellow]")
-                    use_docker = False
-                    session_mgr.update_session(
-                        session.session_id,
-                        container_name=None,
-                        runtime="host",
-                    )
-                else:
-                    claude_cmd = TmuxManager._build_claude_command(
-                        "/workspace",
-                        has_initial_prompt=False,
-                        auto_approve=auto_approve,
-                    )
-                    docker_command = docker_mgr.build_run_command(
-                        session.session_id, worktree_path, claude_cmd
-                    )
-
-            # Start tmux session
-            tmux.create_session(
-                session.tmux_session_name,
-                worktree_path,
-                Path(session.log_file),
-                str(worktree_path),
-                None,  # no initial prompt
-                auto_approve=auto_approve,
-                docker_command=docker_command,
-            )
+        # Start tmux session
+        tmux.create_session(
+            session.tmux_session_name,
+            worktree_path,
+            Path(session.log_file),
+            str(worktree_path),
+            None,  # no initial prompt
+            auto_approve=auto_approve,
+            docker_command=docker_command,
+        )
 
-            # Update experiment
+        # Update experiment
+        with assign_lock:
             experiment.status = ExperimentStatus.ASSIGNED
             experiment.session_id = session.session_id
-            experiment.updated_at = datetime.utcnow()
-            study.updated_at = datetime.utcnow()
-            storage.save_study(res.researcher_id, study)
-
-            # Auto-start preview if project has preview config
-            try:
-                project = _find_project_for_researcher(res, data_dir)
-                if project and project.preview:
-                    from beehive.core.preview import PreviewManager
-
-                    preview_mgr = PreviewManager(data_dir)
-                    preview_url = preview_mgr.start_preview(
-                        session_id=session.session_id,
-                        task_name=experiment.title,
-                        working_directory=str(worktree_path),
-                        setup_command=project.preview.setup_command,
-                        teardown_command=project.preview.teardown_command,
-                        url_template=project.preview.url_template,
-                        startup_timeout=project.preview.startup_timeout,
-                    )
-                    session_mgr.update_session(session.session_id, preview_url=preview_url)
-                    console.print(f"  Preview: [cyan]{preview_url}[/cyan]")
-            except Exception as e:
-                console.print(f"  [yellow]Warning: Preview failed: {e}[/yellow]")
-
-            runtime_label = "docker" if use_docker else "host"
-            console.print(
-                f"[green]\u2713[/green] Assigned [bold]{experiment.title}[/bold] "
-                f"-> session [cyan]{session.session_id}[/cyan] ({runtime_label})"
-            )
+            experiment.updated_at = study.updated_at = datetime.utcnow()
+            if save:
+                storage.save_study(res.researcher_id, study)
 
+        # Auto-start preview if project has preview config
+        try:
+            project = linked_project()
+            if project and project.preview:
+                from beehive.core.preview import PreviewManager
+
+                preview_mgr = PreviewManager(data_dir)
+                preview_url = preview_mgr.start_preview(
+                    session_id=session.session_id,
+                    task_name=experiment.title,
+                    working_directory=str(worktree_path),
+                    setup_command=project.preview.setup_command,
+                    teardown_command=project.preview.teardown_command,
+                    url_template=project.preview.url_template,
+                    startup_timeout=project.preview.startup_timeout,
+                )
+                session_mgr.update_session(session.session_id, preview_url=preview_url)
+                console.print(f"  Preview: [cyan]{preview_url}[/cyan]")
         except Exception as e:
-            console.print(f"[red]Error assigning '{experiment.title}': {e}[/red]")
-            continue
+            console.print(f"  [yellow]Warning: Preview failed: {e}[/yellow]")
+
+        runtime_label = "docker" if use_docker else "host"
+        console.print(
+            f"[green]\u2713[/green] Assigned [bold]{experiment.title}[/bold] "
+            f"-> session [cyan]{session.session_id}[/cyan] ({runtime_label})"
+        )
+        return session.session_id
+
+    except Exception as e:
+        console.print(f"[red]Error assigning '{experiment.title}': {e}[/red]")
+        return None
 
 
 @researcher.command("status")
@@ -453,40 +478,16 @@ def study_status(ctx, researcher_id: str, study_id: Optional[str]):
         study = res.studies[-1]
 
     # Sync experiment statuses from beehive sessions
-    from beehive.core.session import SessionManager
-
-    data_dir = ctx.obj.get("data_dir", Path.home() / ".beehive")
-    session_mgr = ctx.obj.get("session_manager", SessionManager(data_dir))
-
-    synced = False
-    for experiment in study.experiments:
-        if experiment.status in (ExperimentStatus.ASSIGNED, ExperimentStatus.IN_PROGRESS) and experiment.session_id:
-            session = session_mgr.get_session(experiment.session_id)
-            if not session:
-                continue
-
-            if session.status == "completed":
-                experiment.status = ExperimentStatus.COMPLETED
-                experiment.updated_at = datetime.utcnow()
-                synced = True
-            elif session.status in ("failed", "stopped"):
-                experiment.status = ExperimentStatus.FAILED
-                experiment.updated_at = datetime.utcnow()
-                synced = True
-
-            if not experiment.output_dir and session.working_directory:
-                experiment.output_dir = session.working_directory
-                experiment.updated_at = datetime.utcnow()
-                synced = True
+    session_mgr = ctx_service(ctx, "session_manager")
 
+    now = datetime.utcnow()
+    synced = _sync_experiments_from_sessions(study, session_mgr, now)
     if synced:
-        study.updated_at = datetime.utcnow()
+        study.updated_at = now
         storage.save_study(res.researcher_id, study)
 
     # Summary
-    counts = {}
-    for e in study.experiments:
-        counts[e.status] = counts.get(e.status, 0) + 1
+    counts = Counter(e.status for e in study.experiments)
 
     summary_parts = []
     for status_val in ["pending", "assigned", "in_progress", "completed", "failed"]:
@@ -500,8 +501,49 @@ def study_status(ctx, researcher_id: str, study_id: Optional[str]):
     _print_experiments_table(study.experiments)
 
 
+def _sync_experiments_from_sessions(study, session_mgr, now: Optional[datetime] = None) -> bool:
+    """Sync experiment statuses and output dirs from beehive sessions.
+
+    The in-flight experiments' sessions are loaded in one read and every
+    change is stamped with the same ``now``. Returns True if any
+    experiment changed.
+    """
+    active = [
+        e for e in study.experiments
+        if e.status in (ExperimentStatus.ASSIGNED, ExperimentStatus.IN_PROGRESS) and e.session_id
+    ]
+    if not active:
+        return False
+    sessions_by_id = session_mgr.get_sessions(e.session_id for e in active)
+    if now is None:
+        now = datetime.utcnow()
+
+    synced = False
+    for experiment in active:
+        session = sessions_by_id.get(experiment.session_id)
+        if not session:
+            continue
+
+        if session.status == "completed":
+            experiment.status = ExperimentStatus.COMPLETED
+            experiment.updated_at = now
+            synced = True
+        elif session.status in ("failed", "stopped"):
+            experiment.status = ExperimentStatus.FAILED
+            experiment.updated_at = now
+            synced = True
+
+        if not experiment.output_dir and session.working_directory:
+            experiment.output_dir = session.working_directory
+            experiment.updated_at = now
+            synced = True
+    return synced
+
+
 def _find_project_for_researcher(researcher, data_dir: Path):
     """Find a project whose repos overlap with this researcher's repos."""
+    from beehive.core.project_storage import ProjectStorage
+
     project_storage = ProjectStorage(data_dir)
     researcher_paths = {r.path for r in researcher.repos}
     for proj in project_storage.load_all_projects():
@@ -513,6 +555,8 @@ def _find_project_for_researcher(researcher, data_dir: Path):
 
 def _print_experiments_table(experiments):
     """Print a Rich table of experiments."""
+    from rich.table import Table
+
     table = Table()
     table.add_column("ID", style="cyan")
     table.add_column("Title")
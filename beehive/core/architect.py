@@ -3,6 +3,7 @@
 import uuid
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -28,6 +29,11 @@ class ArchitectRepo(BaseModel):
     description: str = ""  # what this repo is for
 
 
+def find_repo(repos: list[ArchitectRepo], name: str) -> Optional[ArchitectRepo]:
+    """Return the first repo called ``name``, or None."""
+    return next((r for r in repos if r.name == name), None)
+
+
 class Ticket(BaseModel):
     """A discrete unit of work targeting one repo and one PR."""
 
@@ -65,6 +71,11 @@ class Plan(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
+    @property
+    def sorted_tickets(self) -> list[Ticket]:
+        """Tickets in execution order (by ``order``, stable for ties)."""
+        return sorted(self.tickets, key=attrgetter("order"))
+
 
 class Architect(BaseModel):
     """An architect configuration with principles and repo responsibilities."""
@@ -77,3 +88,7 @@ class Architect(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     model_config = ConfigDict(use_enum_values=True)
+
+    def get_repo(self, name: str) -> Optional[ArchitectRepo]:
+        """Look up a repo by name."""
+        return find_repo(self.repos, name)
@@ -3,10 +3,12 @@
 import fcntl
 import json
 from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from beehive.core.architect import Architect, Plan, Ticket
+from beehive.utils.serialization import dumps_pretty
 
 
 class ArchitectStorage:
@@ -36,7 +38,7 @@ class ArchitectStorage:
     @contextmanager
     def _lock_file(self, filepath: Path):
         """File locking for concurrent access safety."""
-        with open(filepath, "r+") as f:
+        with open(filepath, "r+", encoding="utf-8") as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_EX)
             try:
                 yield f
@@ -88,10 +90,47 @@ class ArchitectStorage:
                 return a
         return None
 
+    def load_architect_meta(self, architect_id: str) -> Optional[Architect]:
+        """Load architect by ID (supports partial match) without its plans.
+
+        The returned Architect has an empty plans list; pair it with
+        load_latest_plan or load_plan to fetch only the plan needed.
+        """
+        try:
+            with open(self.architects_file, encoding="utf-8") as f:
+                content = f.read()
+                data = json.loads(content) if content.strip() else []
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        for arch_data in data:
+            if arch_data["architect_id"].startswith(architect_id):
+                return Architect(**arch_data)
+        return None
+
+    def load_many(self, architect_ids) -> dict[str, Architect]:
+        """Load several architects by exact ID in one read, keyed by ID.
+
+        Like load_architect_meta, plans are not loaded. IDs that don't
+        exist are simply absent from the result.
+        """
+        wanted = set(architect_ids)
+        if not wanted:
+            return {}
+        try:
+            with open(self.architects_file, encoding="utf-8") as f:
+                content = f.read()
+                data = json.loads(content) if content.strip() else []
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return {
+            a["architect_id"]: Architect(**a) for a in data if a["architect_id"] in wanted
+        }
+
     def load_all_architects(self) -> list[Architect]:
         """Load all architects with their plans."""
         try:
-            with open(self.architects_file) as f:
+            with open(self.architects_file, encoding="utf-8") as f:
                 content = f.read()
                 data = json.loads(content) if content.strip() else []
 
@@ -105,6 +144,38 @@ class ArchitectStorage:
         except (FileNotFoundError, json.JSONDecodeError):
             return []
 
+    def load_summaries(self) -> list[dict]:
+        """Load listing fields for every architect without validating plans.
+
+        Each entry has architect_id, name, repo_names, plan_count and
+        created_at (a datetime). Plans files are only parsed to count
+        their entries.
+        """
+        try:
+            with open(self.architects_file, encoding="utf-8") as f:
+                content = f.read()
+                data = json.loads(content) if content.strip() else []
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+        summaries = []
+        for arch_data in data:
+            architect_id = arch_data["architect_id"]
+            try:
+                with open(self._plans_file(architect_id), encoding="utf-8") as f:
+                    content = f.read()
+                    plan_count = len(json.loads(content)) if content.strip() else 0
+            except (FileNotFoundError, json.JSONDecodeError):
+                plan_count = 0
+            summaries.append({
+                "architect_id": architect_id,
+                "name": arch_data["name"],
+                "repo_names": [r["name"] for r in arch_data.get("repos", [])],
+                "plan_count": plan_count,
+                "created_at": datetime.fromisoformat(arch_data["created_at"]),
+            })
+        return summaries
+
     def delete_architect(self, architect_id: str) -> None:
         """Remove architect from storage."""
         # Find full ID first
@@ -134,7 +205,12 @@ class ArchitectStorage:
     # --- Plan CRUD ---
 
     def save_plan(self, architect_id: str, plan: Plan) -> None:
-        """Save or update a plan for an architect."""
+        """Save or update a plan for an architect.
+
+        The file is left untouched when the serialized plans are identical
+        to what is already on disk, so repeated saves from a polling loop
+        don't rewrite the whole file.
+        """
         plans_file = self._plans_file(architect_id)
         if not plans_file.exists():
             self._architect_dir(architect_id).mkdir(parents=True, exist_ok=True)
@@ -158,15 +234,19 @@ class ArchitectStorage:
             if not updated:
                 plans.append(plan_data)
 
+            serialized = dumps_pretty(plans)
+            if serialized == content:
+                return
+
             f.seek(0)
             f.truncate()
-            json.dump(plans, f, indent=2, default=str)
+            f.write(serialized)
 
     def _load_plans(self, architect_id: str) -> list[Plan]:
         """Load all plans for an architect, backfilling ticket order if needed."""
         plans_file = self._plans_file(architect_id)
         try:
-            with open(plans_file) as f:
+            with open(plans_file, encoding="utf-8") as f:
                 content = f.read()
                 data = json.loads(content) if content.strip() else []
                 plans = [Plan(**p) for p in data]
@@ -176,10 +256,7 @@ class ArchitectStorage:
         # Migrate: backfill order for tickets with order == 0
         migrated = False
         for plan in plans:
-            for idx, ticket in enumerate(plan.tickets):
-                if ticket.order == 0:
-                    ticket.order = idx + 1
-                    migrated = True
+            migrated |= _backfill_ticket_order(plan)
 
         if migrated:
             self._save_plans_list(architect_id, plans)
@@ -197,7 +274,23 @@ class ArchitectStorage:
             f.seek(0)
             f.truncate()
             plans_data = [p.model_dump(mode="json") for p in plans]
-            json.dump(plans_data, f, indent=2, default=str)
+            f.write(dumps_pretty(plans_data))
+
+    def load_latest_plan(self, architect_id: str) -> Optional[Plan]:
+        """Load the most recently created plan, validating only that entry."""
+        try:
+            with open(self._plans_file(architect_id), encoding="utf-8") as f:
+                content = f.read()
+                data = json.loads(content) if content.strip() else []
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not data:
+            return None
+
+        plan = Plan(**data[-1])
+        # Same order backfill as _load_plans; persisted on the next save
+        _backfill_ticket_order(plan)
+        return plan
 
     def load_plan(self, architect_id: str, plan_id: str) -> Optional[Plan]:
         """Load a specific plan by ID (supports partial match)."""
@@ -225,3 +318,13 @@ class ArchitectStorage:
                     if ticket.ticket_id.startswith(ticket_id):
                         return (architect, plan, ticket)
         return None
+
+
+def _backfill_ticket_order(plan: Plan) -> bool:
+    """Number tickets saved before ordering existed. Returns True if any changed."""
+    migrated = False
+    for idx, ticket in enumerate(plan.tickets):
+        if ticket.order == 0:
+            ticket.order = idx + 1
+            migrated = True
+    return migrated
@@ -4,6 +4,29 @@ from pathlib import Path
 from typing import Optional
 
 
+# Global prompt file contents (system_prompt.txt, CLAUDE.md) keyed by
+# path -> ((mtime_ns, size), stripped text)
+_TEXT_FILE_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def _read_text_cached(path: Path) -> Optional[str]:
+    """Read and strip a text file, re-reading only when its mtime or size changes."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _TEXT_FILE_CACHE.pop(path, None)
+        return None
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _TEXT_FILE_CACHE.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    text = path.read_text().strip()
+    _TEXT_FILE_CACHE[path] = (key, text)
+    return text
+
+
 CLAUDE_MD_MARKER = "<!-- Beehive Agent Defaults -->"
 CLAUDE_MD_PROJECT_MARKER = "<!-- Project CLAUDE.md -->"
 
@@ -57,16 +80,17 @@ class BeehiveConfig:
         Load the global system prompt that applies to all agents.
 
         This file contains rules and guidelines that every agent must follow.
-        It's prepended to user-provided instructions.
+        It's prepended to user-provided instructions. The contents are
+        cached per process and re-read only when the file's mtime or size
+        changes.
         """
-        if self.system_prompt_file.exists():
-            return self.system_prompt_file.read_text().strip()
-        return None
+        return _read_text_cached(self.system_prompt_file)
 
     def set_system_prompt(self, prompt: str) -> None:
         """Set the global system prompt."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.system_prompt_file.write_text(prompt)
+        _TEXT_FILE_CACHE.pop(self.system_prompt_file, None)
 
     def get_system_prompt_path(self) -> Path:
         """Get the path to the system prompt file for editing."""
@@ -188,16 +212,17 @@ class BeehiveConfig:
         return "\n\n".join(parts) + "\n"
 
     def get_claude_md(self) -> Optional[str]:
-        """Read the default CLAUDE.md template. Returns None if missing or empty."""
-        if self.claude_md_file.exists():
-            content = self.claude_md_file.read_text().strip()
-            return content if content else None
-        return None
+        """Read the default CLAUDE.md template. Returns None if missing or empty.
+
+        Cached like the system prompt, since every assigned worktree gets it.
+        """
+        return _read_text_cached(self.claude_md_file) or None
 
     def set_claude_md(self, content: str) -> None:
         """Write the default CLAUDE.md template."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.claude_md_file.write_text(content)
+        _TEXT_FILE_CACHE.pop(self.claude_md_file, None)
 
     def get_claude_md_path(self) -> Path:
         """Return the path to the CLAUDE.md template file."""
@@ -130,6 +130,26 @@ class DockerManager:
         )
         return result.returncode == 0
 
+    def list_running_container_names(self) -> Optional[set[str]]:
+        """Names of all running containers, from a single `docker ps` call.
+
+        Returns None if docker can't be queried (missing, timed out or
+        erroring), so callers don't mistake an unreachable daemon for one
+        with no containers running.
+        """
+        try:
+            result = subprocess.run(
+                ["docker", "ps", "--format", "{{.Names}}"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        return set(result.stdout.split())
+
     def container_running(self, session_id: str) -> bool:
         """Check if a container is currently running."""
         container_name = f"beehive-{session_id}"
@@ -1,5 +1,8 @@
 """Git operations wrapper."""
 
+import configparser
+import functools
+import os
 import re
 import subprocess
 from pathlib import Path
@@ -254,6 +257,92 @@ class GitOperations:
         return any(Path(w["worktree"]) == worktree_path for w in worktrees)
 
 
+def _git_config_paths(repo_path: Optional[Path] = None) -> list[Path]:
+    """Global (and optionally repo-local) git config files, lowest precedence first."""
+    global_override = os.environ.get("GIT_CONFIG_GLOBAL")
+    if global_override:
+        paths = [Path(global_override)]
+    else:
+        xdg_home = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+        paths = [Path(xdg_home) / "git" / "config", Path.home() / ".gitconfig"]
+    if repo_path is not None:
+        paths.append(Path(repo_path) / ".git" / "config")
+    return paths
+
+
+# Characters whose meaning in git config (quotes, escapes, inline comments)
+# configparser doesn't reproduce; values containing them are left to git
+_GIT_CONFIG_SPECIAL = frozenset('"\\#;')
+
+
+def _read_git_identity_from_files(paths: list[Path]) -> Optional[tuple[str, str]]:
+    """Parse user.name/user.email out of git config files in-process.
+
+    Returns None when the files can't be trusted to give the full answer
+    (missing values, include directives, INI that configparser rejects, or
+    values using git's quoting, escapes or inline comments, which
+    configparser doesn't decode the same way), so the caller can fall back
+    to asking git itself.
+    """
+    values = {}
+    for path in paths:
+        if not path.is_file():
+            continue
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        try:
+            parser.read(path, encoding="utf-8")
+        except (configparser.Error, UnicodeDecodeError):
+            return None
+        for section in parser.sections():
+            name = section.strip().lower()
+            if name == "include" or name.startswith("includeif"):
+                return None
+            if name != "user":
+                continue
+            for key in ("name", "email"):
+                value = parser.get(section, key, fallback=None)
+                if value and any(c in value for c in _GIT_CONFIG_SPECIAL):
+                    return None
+                if value:
+                    values[key] = value.strip()
+    if values.get("name") and values.get("email"):
+        return values["name"], values["email"]
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_git_identity(repo_path: Optional[Path] = None) -> tuple[str, str]:
+    """Return (user.name, user.email) for commits made on the agent's behalf.
+
+    Reads the global and repo git config files directly and only spawns
+    git when that isn't conclusive. Falls back to a generic Beehive
+    identity for any value that isn't set. Cached per repo for the life
+    of the process, since batch assignment asks once per ticket.
+    """
+    identity = None
+    # Worktrees keep their config elsewhere (.git is a file), so let git resolve those
+    if repo_path is None or (Path(repo_path) / ".git").is_dir():
+        identity = _read_git_identity_from_files(_git_config_paths(repo_path))
+    if identity:
+        return identity
+
+    result = subprocess.run(
+        ["git", "config", "--get-regexp", r"^user\.(name|email)$"],
+        capture_output=True,
+        text=True,
+        cwd=str(repo_path) if repo_path is not None else None,
+    )
+    # Entries are listed system → global → local, so later lines win
+    values = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        values[key] = value.strip()
+    return (
+        values.get("user.name") or "Beehive Agent",
+        values.get("user.email") or "agent@beehive",
+    )
+
+
 def generate_branch_name(session_name: str, session_id: str) -> str:
     """Generate branch name: beehive/<sanitized-name>-<id>"""
     # Sanitize session name: lowercase, replace non-alphanumeric with dashes
@@ -88,6 +88,20 @@ class PreviewManager:
         except OSError:
             return False
 
+    @classmethod
+    def _alive_pids(cls, pids) -> set[int]:
+        """Return the subset of pids that are running.
+
+        Uses one /proc listing where available instead of a signal per pid
+        (which also misreports processes owned by other users as dead).
+        """
+        pids = set(pids)
+        try:
+            running = {int(name) for name in os.listdir("/proc") if name.isdigit()}
+        except OSError:
+            return {pid for pid in pids if cls._is_process_alive(pid)}
+        return pids & running
+
     def start_preview(
         self,
         session_id: str,
@@ -137,7 +151,7 @@ class PreviewManager:
                 env=env,
                 stdout=log_fh,
                 stderr=log_fh,
-                preexec_fn=os.setsid,
+                start_new_session=True,
             )
 
             state = PreviewState(
@@ -175,31 +189,56 @@ class PreviewManager:
             if not target:
                 return False
 
-            # Run teardown command if specified
-            if target.teardown_command:
-                try:
-                    subprocess.run(
-                        target.teardown_command,
-                        shell=True,
-                        cwd=target.working_directory,
-                        timeout=10,
-                        capture_output=True,
-                    )
-                except Exception:
-                    pass
+            self._shutdown(target)
+            self._save_states(remaining, f)
+            return True
+
+    def stop_all_previews(self) -> list[str]:
+        """Stop every tracked preview. Returns the session IDs that were stopped.
+
+        Teardown commands run concurrently, under a single hold of the
+        state file lock.
+        """
+        with self._lock_file(self.state_file) as f:
+            f.seek(0)
+            content = f.read()
+            states = [
+                PreviewState(**s)
+                for s in (json.loads(content) if content.strip() else [])
+            ]
+            if not states:
+                return []
+
+            from concurrent.futures import ThreadPoolExecutor
 
-            # Kill the process group
-            if self._is_process_alive(target.pid):
+            with ThreadPoolExecutor(max_workers=min(len(states), 16)) as pool:
+                list(pool.map(self._shutdown, states))
+
+            self._save_states([], f)
+        return [s.session_id for s in states]
+
+    def _shutdown(self, target: PreviewState) -> None:
+        """Run a preview's teardown command and kill its process group."""
+        if target.teardown_command:
+            try:
+                subprocess.run(
+                    target.teardown_command,
+                    shell=True,
+                    cwd=target.working_directory,
+                    timeout=10,
+                    capture_output=True,
+                )
+            except Exception:
+                pass
+
+        if self._is_process_alive(target.pid):
+            try:
+                os.killpg(os.getpgid(target.pid), signal.SIGTERM)
+            except OSError:
                 try:
-                    os.killpg(os.getpgid(target.pid), signal.SIGTERM)
+                    os.kill(target.pid, signal.SIGKILL)
                 except OSError:
-                    try:
-                        os.kill(target.pid, signal.SIGKILL)
-                    except OSError:
-                        pass
-
-            self._save_states(remaining, f)
-            return True
+                    pass
 
     def restart_preview(self, session_id: str) -> Optional[str]:
         """Stop and restart a preview, keeping the same port. Returns new URL or None."""
@@ -220,28 +259,7 @@ class PreviewManager:
             if not target:
                 return None
 
-            # Run teardown command
-            if target.teardown_command:
-                try:
-                    subprocess.run(
-                        target.teardown_command,
-                        shell=True,
-                        cwd=target.working_directory,
-                        timeout=10,
-                        capture_output=True,
-                    )
-                except Exception:
-                    pass
-
-            # Kill the process group
-            if self._is_process_alive(target.pid):
-                try:
-                    os.killpg(os.getpgid(target.pid), signal.SIGTERM)
-                except OSError:
-                    try:
-                        os.kill(target.pid, signal.SIGKILL)
-                    except OSError:
-                        pass
+            self._shutdown(target)
 
             # Re-launch with the same port and env
             backend_port = target.port + 1000
@@ -261,7 +279,7 @@ class PreviewManager:
                 env=env,
                 stdout=log_fh,
                 stderr=log_fh,
-                preexec_fn=os.setsid,
+                start_new_session=True,
             )
 
             # Update PID in state
@@ -284,6 +302,14 @@ class PreviewManager:
 
     def cleanup_dead_previews(self) -> int:
         """Remove stale entries for dead processes. Returns count removed."""
+        return self.list_previews_with_cleanup()[1]
+
+    def list_previews_with_cleanup(self) -> tuple[list[PreviewState], int]:
+        """Drop entries for dead processes and return (live previews, count removed).
+
+        One locked read of the state file covers both the cleanup and the
+        listing.
+        """
         with self._lock_file(self.state_file) as f:
             f.seek(0)
             content = f.read()
@@ -292,15 +318,11 @@ class PreviewManager:
                 for s in (json.loads(content) if content.strip() else [])
             ]
 
-            alive = []
-            removed = 0
-            for s in states:
-                if self._is_process_alive(s.pid):
-                    alive.append(s)
-                else:
-                    removed += 1
+            live_pids = self._alive_pids(s.pid for s in states)
+            alive = [s for s in states if s.pid in live_pids]
+            removed = len(states) - len(alive)
 
             if removed > 0:
                 self._save_states(alive, f)
 
-        return removed
+        return alive, removed
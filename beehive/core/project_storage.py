@@ -65,6 +65,29 @@ class ProjectStorage:
             f.truncate()
             json.dump(projects, f, indent=2, default=str)
 
+    def update_fields(self, project_id: str, **fields) -> bool:
+        """Overwrite top-level fields of a stored project without re-dumping the model.
+
+        Values must already be in their JSON form (e.g. a list of IDs).
+        Returns False if no project has that exact ID.
+        """
+        with self._lock_file(self.projects_file) as f:
+            f.seek(0)
+            content = f.read()
+            projects = json.loads(content) if content.strip() else []
+
+            for p in projects:
+                if p["project_id"] == project_id:
+                    p.update(fields)
+                    break
+            else:
+                return False
+
+            f.seek(0)
+            f.truncate()
+            json.dump(projects, f, indent=2, default=str)
+        return True
+
     def load_project(self, project_id: str) -> Optional[Project]:
         projects = self.load_all_projects()
         for p in projects:
@@ -115,6 +138,21 @@ class ProjectStorage:
         except (FileNotFoundError, json.JSONDecodeError):
             return CTOConversation()
 
+    def load_conversation_tail(self, project_id: str, n: int) -> tuple[list[CTOMessage], int]:
+        """Return the last n messages and the total message count.
+
+        Only the returned messages are validated into CTOMessage models.
+        """
+        conv_file = self._conversation_file(project_id)
+        try:
+            with open(conv_file) as f:
+                content = f.read()
+                data = json.loads(content) if content.strip() else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return [], 0
+        raw = data.get("messages", [])
+        return [CTOMessage(**m) for m in raw[-n:]], len(raw)
+
     def save_conversation(self, project_id: str, conversation: CTOConversation) -> None:
         self._project_dir(project_id).mkdir(parents=True, exist_ok=True)
         conv_file = self._conversation_file(project_id)
@@ -7,7 +7,7 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from beehive.core.architect import ArchitectRepo
+from beehive.core.architect import ArchitectRepo, find_repo
 
 
 class ExperimentStatus(str, Enum):
@@ -59,3 +59,7 @@ class Researcher(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     model_config = ConfigDict(use_enum_values=True)
+
+    def get_repo(self, name: str) -> Optional[ArchitectRepo]:
+        """Look up a repo by name."""
+        return find_repo(self.repos, name)
@@ -96,6 +96,10 @@ class SessionManager:
         """Retrieve session by ID (supports partial ID matching)."""
         return self.storage.load_session(session_id)
 
+    def get_sessions(self, session_ids) -> dict[str, AgentSession]:
+        """Retrieve several sessions by exact ID with one storage read."""
+        return {s.session_id: s for s in self.storage.load_sessions(session_ids)}
+
     def list_sessions(
         self, status_filter: Optional[SessionStatus] = None
     ) -> list[AgentSession]:
@@ -132,13 +136,16 @@ class SessionManager:
 
         Detection methods:
         1. `.beehive-done` marker file (written by agent command on exit)
-        2. Docker container no longer running (for docker sessions)
+        2. Docker container no longer running (for docker sessions; skipped
+           if `docker ps` fails or times out)
 
         Returns list of session IDs that were auto-completed.
         """
-        import subprocess as _sp
+        from beehive.core.docker_manager import DockerManager
 
         completed_ids = []
+        running_containers = None
+        docker_queried = False
         for session in self.list_sessions(status_filter=SessionStatus.RUNNING):
             done = False
 
@@ -147,14 +154,14 @@ class SessionManager:
             if done_marker.exists():
                 done = True
 
-            # Check 2: Docker container exited
+            # Check 2: Docker container exited (one `docker ps` covers every session)
             if not done and session.container_name:
-                result = _sp.run(
-                    ["docker", "inspect", "--format", "{{.State.Running}}", session.container_name],
-                    capture_output=True, text=True,
-                )
-                # Container doesn't exist (removed by --rm) or is not running
-                if result.returncode != 0 or result.stdout.strip() != "true":
+                if not docker_queried:
+                    running_containers = DockerManager().list_running_container_names()
+                    docker_queried = True
+                # Skipped when docker couldn't be queried: an unreachable
+                # daemon says nothing about whether the container exited
+                if running_containers is not None and session.container_name not in running_containers:
                     done = True
 
             if done:
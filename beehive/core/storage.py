@@ -62,20 +62,36 @@ class SessionStorage:
             json.dump(sessions, f, indent=2, default=str)
 
     def load_session(self, session_id: str) -> Optional[AgentSession]:
-        """Load session by ID (supports partial match)."""
-        sessions = self.load_all_sessions()
-        for s in sessions:
-            if s.session_id.startswith(session_id):
-                return s
+        """Load session by ID (supports partial match).
+
+        Only the matching record is validated into an AgentSession; the
+        rest of the file is left as raw dicts.
+        """
+        for s in self._load_raw():
+            if s["session_id"].startswith(session_id):
+                return AgentSession(**s)
         return None
 
+    def load_sessions(self, session_ids) -> list[AgentSession]:
+        """Load the sessions with the given exact IDs in one read.
+
+        Records for other sessions are skipped without validation.
+        """
+        wanted = set(session_ids)
+        if not wanted:
+            return []
+        return [AgentSession(**s) for s in self._load_raw() if s["session_id"] in wanted]
+
     def load_all_sessions(self) -> list[AgentSession]:
         """Load all sessions."""
+        return [AgentSession(**s) for s in self._load_raw()]
+
+    def _load_raw(self) -> list[dict]:
+        """Read session records as plain dicts without validation."""
         try:
             with open(self.sessions_file) as f:
                 content = f.read()
-                data = json.loads(content) if content.strip() else []
-                return [AgentSession(**s) for s in data]
+                return json.loads(content) if content.strip() else []
         except (FileNotFoundError, json.JSONDecodeError):
             return []
 
@@ -150,10 +150,12 @@ class TmuxManager:
             check=True,
         )
 
-    def kill_session(self, session_name: str) -> None:
-        """Terminate tmux session."""
-        if self.session_exists(session_name):
-            subprocess.run(["tmux", "kill-session", "-t", session_name], check=True)
+    def kill_session(self, session_name: str) -> bool:
+        """Terminate tmux session. Returns False if it wasn't running."""
+        result = subprocess.run(
+            ["tmux", "kill-session", "-t", session_name], capture_output=True
+        )
+        return result.returncode == 0
 
     def list_sessions(self) -> list[str]:
         """List all tmux sessions."""
@@ -43,6 +43,7 @@ from beehive.tui.modals import (
     SendPromptModal,
     UnlinkArchitectModal,
 )
+from beehive.utils.config import Config
 
 
 # ─── Data layer ───────────────────────────────────────────────────────────────
@@ -841,7 +842,7 @@ class ArchitectsView(Container):
         )
         table = self.query_one("#arch-table", DataTable)
         self._set_columns(table, "tickets", ("#", "Id", "Title", "Repo", "Status", "Branch", "Session", "PR"))
-        self._sorted_tickets = sorted(p.tickets, key=lambda t: t.order)
+        self._sorted_tickets = p.sorted_tickets
         for t in self._sorted_tickets:
             status_display = {
                 "pending": "[#888888]pending[/]",
@@ -1517,10 +1518,8 @@ class AgentsView(Container):
         try:
             store = self.app.store
             if session.runtime == "docker":
-                if store.docker.container_running(session.session_id):
-                    store.docker.stop_container(session.session_id)
-            if store.tmux.session_exists(session.tmux_session_name):
-                store.tmux.kill_session(session.tmux_session_name)
+                store.docker.stop_container(session.session_id)
+            store.tmux.kill_session(session.tmux_session_name)
             store.session_mgr.update_session(
                 session.session_id, status=SessionStatus.STOPPED
             )
@@ -1543,10 +1542,8 @@ class AgentsView(Container):
         try:
             store = self.app.store
             if session.runtime == "docker":
-                if store.docker.container_running(session.session_id):
-                    store.docker.stop_container(session.session_id)
-            if store.tmux.session_exists(session.tmux_session_name):
-                store.tmux.kill_session(session.tmux_session_name)
+                store.docker.stop_container(session.session_id)
+            store.tmux.kill_session(session.tmux_session_name)
             worktree_path = Path(session.working_directory)
             if session.runtime == "docker":
                 if worktree_path.exists():
@@ -1616,7 +1613,7 @@ class BeehiveApp(App):
 
     def __init__(self, data_dir: Path | None = None):
         super().__init__()
-        self.data_dir = data_dir or Path.home() / ".beehive"
+        self.data_dir = data_dir or Config.DEFAULT_DATA_DIR
         self.store = DataStore(self.data_dir)
         self._refresh_timer: Timer | None = None
 
@@ -1,12 +1,14 @@
 """Configuration management for Beehive."""
 
+import os
 from pathlib import Path
 
 
 class Config:
     """Configuration for Beehive."""
 
-    DEFAULT_DATA_DIR = Path.home() / ".beehive"
+    # Resolved once at import; BEEHIVE_DATA_DIR overrides ~/.beehive
+    DEFAULT_DATA_DIR = Path(os.environ.get("BEEHIVE_DATA_DIR") or Path.home() / ".beehive")
     DEFAULT_BASE_BRANCH = "main"
 
     @classmethod
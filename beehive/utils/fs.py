@@ -0,0 +1,40 @@
+"""Filesystem helpers."""
+
+import os
+import stat
+import uuid
+from pathlib import Path
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write bytes to path via a temp file + rename so readers never see a partial file.
+
+    The temp file is created 0666 minus the process umask (what a plain
+    open() would give, since prompt files are mounted into containers);
+    when path already exists, its current mode is kept instead.
+    """
+    path = Path(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex[:12]}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            # Raw fd writes; no need for a buffered file object for one blob
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,29 @@
+"""JSON encoding/decoding helpers that use orjson when it is installed."""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+def dumps_pretty(data) -> str:
+    """Serialize to 2-space indented JSON in the same layout as ``json.dumps(indent=2)``.
+
+    Intended for ``model_dump(mode="json")`` output; orjson writes
+    non-ASCII characters as UTF-8 rather than ``\\u`` escapes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. non-str dict keys or ints beyond 64 bits
+    return json.dumps(data, indent=2, default=str)
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes (e.g. raw subprocess output)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,53 @@
+"""Cached loading of YAML config files."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+from beehive.utils.fs import atomic_write
+from beehive.utils.serialization import json_loads
+
+
+def load_yaml_config(path: Path, cache_dir: Optional[Path] = None):
+    """Parse a YAML config file, reusing a JSON copy of the parse from cache_dir if unchanged.
+
+    Cache entries are keyed on the file's resolved path and validated
+    against a SHA-256 of its contents, so touching or copying the file
+    keeps the entry valid while any edit invalidates it. A missing, stale
+    or unreadable entry is re-parsed (with libyaml's loader when
+    available) and rewritten.
+    Configs that don't survive a JSON round trip unchanged (timestamps,
+    non-string keys) are simply never cached.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    stamp = hashlib.sha256(raw).hexdigest()
+
+    cache_file = None
+    if cache_dir is not None:
+        key = hashlib.blake2b(str(path.resolve()).encode(), digest_size=16).hexdigest()
+        cache_file = Path(cache_dir) / f"{key}.json"
+        try:
+            with open(cache_file, "rb") as f:
+                cached_stamp, data = json_loads(f.read())
+            if cached_stamp == stamp:
+                return data
+        except Exception:
+            pass
+
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(raw, Loader=loader)
+
+    if cache_file is not None:
+        try:
+            blob = json.dumps([stamp, data], separators=(",", ":")).encode()
+            if json_loads(blob)[1] == data:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write(cache_file, blob)
+        except (TypeError, ValueError, OSError):
+            pass  # caching is best-effort
+    return data
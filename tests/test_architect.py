@@ -1,6 +1,7 @@
 """Tests for architect feature: models, storage, planner, and CLI."""
 
 import json
+import os
 import subprocess
 import tempfile
 from datetime import datetime
@@ -56,6 +57,35 @@ class TestModels:
         assert len(plan.tickets) == 2
         assert len(plan.plan_id) == 8
 
+    def test_plan_sorted_tickets(self):
+        plan = Plan(directive="Build", tickets=[
+            Ticket(title="B", description="", repo="api", order=2),
+            Ticket(title="A", description="", repo="api", order=1),
+        ])
+        assert [t.title for t in plan.sorted_tickets] == ["A", "B"]
+
+        plan.tickets.append(Ticket(title="C", description="", repo="api", order=3))
+        assert [t.title for t in plan.sorted_tickets] == ["A", "B", "C"]
+
+        # In-place reorders and list replacements are always reflected
+        plan.tickets[0].order = 0
+        assert [t.title for t in plan.sorted_tickets] == ["B", "A", "C"]
+        plan.tickets = [Ticket(title="D", description="", repo="api")] * 3
+        assert [t.title for t in plan.sorted_tickets] == ["D", "D", "D"]
+
+    def test_architect_get_repo(self):
+        arch = Architect(
+            name="test",
+            principles="",
+            repos=[ArchitectRepo(name="api", path="/tmp/api"),
+                   ArchitectRepo(name="api", path="/tmp/api-dup")],
+        )
+        assert arch.get_repo("api").path == "/tmp/api"
+        assert arch.get_repo("web") is None
+
+        arch.repos.append(ArchitectRepo(name="web", path="/tmp/web"))
+        assert arch.get_repo("web").path == "/tmp/web"
+
     def test_architect_repo(self):
         repo = ArchitectRepo(
             name="api",
@@ -330,6 +360,89 @@ class TestArchitectStorage:
             assert reloaded.tickets[0].status == TicketStatus.ASSIGNED
             assert reloaded.tickets[0].session_id == "sess1234"
 
+    def test_load_summaries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = ArchitectStorage(Path(tmpdir))
+            arch = Architect(
+                architect_id="abc12345",
+                name="test",
+                principles="",
+                repos=[ArchitectRepo(name="api", path="/tmp/api"),
+                       ArchitectRepo(name="web", path="/tmp/web")],
+            )
+            storage.save_architect(arch)
+            storage.save_plan("abc12345", Plan(directive="One"))
+            storage.save_plan("abc12345", Plan(directive="Two"))
+
+            (summary,) = storage.load_summaries()
+            assert summary["architect_id"] == "abc12345"
+            assert summary["name"] == "test"
+            assert summary["repo_names"] == ["api", "web"]
+            assert summary["plan_count"] == 2
+            assert summary["created_at"] == arch.created_at
+
+    def test_load_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = ArchitectStorage(Path(tmpdir))
+            for i in range(3):
+                storage.save_architect(Architect(
+                    architect_id=f"id{i}abcde", name=f"arch{i}", principles="", repos=[],
+                ))
+
+            found = storage.load_many(["id0abcde", "id2abcde", "missing1"])
+            assert sorted(found) == ["id0abcde", "id2abcde"]
+            assert found["id2abcde"].name == "arch2"
+            assert storage.load_many([]) == {}
+
+    def test_load_meta_and_latest_plan(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = ArchitectStorage(Path(tmpdir))
+            storage.save_architect(Architect(architect_id="abc12345", name="test", principles="", repos=[]))
+            assert storage.load_latest_plan("abc12345") is None
+
+            storage.save_plan("abc12345", Plan(directive="One"))
+            storage.save_plan("abc12345", Plan(directive="Two", tickets=[
+                Ticket(title="T1", description="D", repo="api"),
+                Ticket(title="T2", description="D", repo="api"),
+            ]))
+
+            meta = storage.load_architect_meta("abc1")
+            assert meta.architect_id == "abc12345"
+            assert meta.plans == []
+
+            latest = storage.load_latest_plan("abc12345")
+            assert latest.directive == "Two"
+            assert [t.order for t in latest.tickets] == [1, 2]
+
+    def test_save_plan_skips_unchanged_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = ArchitectStorage(Path(tmpdir))
+            plan = Plan(plan_id="plan1234", directive="Build auth", tickets=[])
+            storage.save_plan("abc12345", plan)
+
+            plans_file = storage._plans_file("abc12345")
+            os.utime(plans_file, ns=(0, 0))
+            storage.save_plan("abc12345", plan)
+            assert plans_file.stat().st_mtime_ns == 0
+
+            plan.directive = "Build auth v2"
+            storage.save_plan("abc12345", plan)
+            assert storage.load_plan("abc12345", "plan1234").directive == "Build auth v2"
+
+    def test_save_plan_non_ascii_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = ArchitectStorage(Path(tmpdir))
+            plan = Plan(plan_id="plan1234", directive="Café résumé ✓", tickets=[])
+            storage.save_plan("abc12345", plan)
+
+            plans_file = storage._plans_file("abc12345")
+            # Stored as UTF-8 whether or not orjson left the text unescaped
+            assert json.loads(plans_file.read_bytes().decode("utf-8"))[0]["directive"] == plan.directive
+            os.utime(plans_file, ns=(0, 0))
+            storage.save_plan("abc12345", plan)
+            assert plans_file.stat().st_mtime_ns == 0
+            assert storage.load_plan("abc12345", "plan1234").directive == plan.directive
+
 
 # --- YAML Config Parsing Tests ---
 
@@ -861,6 +974,37 @@ class TestSequentialLogic:
         # T2 should be assignable
 
 
+class TestBuildPlanContext:
+    def _plan(self):
+        return Plan(
+            directive="Ship auth",
+            tickets=[
+                Ticket(title="T3", description="D3", repo="api", order=3),
+                Ticket(title="T1", description="D1", repo="api", order=1, status=TicketStatus.MERGED),
+                Ticket(title="T2", description="D2", repo="api", order=2),
+            ],
+        )
+
+    def test_sections_in_order(self):
+        """Previous and future tickets land on the right side of the marker."""
+        from beehive.cli_architect import _build_plan_context
+
+        plan = self._plan()
+        current = next(t for t in plan.tickets if t.order == 2)
+        context = _build_plan_context(current, plan)
+
+        assert context.index("COMPLETED BEFORE YOUR TASK:") < context.index("#1. [merged] T1")
+        assert context.index("#1. [merged] T1") < context.index(">>> YOUR TASK (#2): T2")
+        assert context.index(">>> YOUR TASK (#2): T2") < context.index("PLANNED AFTER YOUR TASK:")
+        assert context.index("PLANNED AFTER YOUR TASK:") < context.index("#3. T3")
+
+    def test_single_ticket_has_no_context(self):
+        from beehive.cli_architect import _build_plan_context
+
+        plan = Plan(directive="x", tickets=[Ticket(title="T", description="D", repo="api")])
+        assert _build_plan_context(plan.tickets[0], plan) is None
+
+
 class TestGetPrState:
     @patch("beehive.cli_architect.subprocess.run")
     def test_pr_merged(self, mock_run):
@@ -911,3 +1055,281 @@ class TestGetPrState:
 
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="gh", timeout=15)
         assert _get_pr_state("https://github.com/test/repo/pull/1") is None
+
+
+class TestListPrsForRepo:
+    @patch("beehive.cli_architect.subprocess.run")
+    def test_indexed_by_branch_and_url(self, mock_run):
+        """One gh call indexes PRs by head branch and URL, newest PR per branch."""
+        from beehive.cli_architect import _list_prs_for_repo
+
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=json.dumps([
+                {"url": "https://gh/pull/3", "headRefName": "feat-a", "state": "OPEN"},
+                {"url": "https://gh/pull/2", "headRefName": "feat-b", "state": "MERGED"},
+                {"url": "https://gh/pull/1", "headRefName": "feat-a", "state": "CLOSED"},
+            ]),
+        )
+        prs = _list_prs_for_repo("/tmp/repo")
+        mock_run.assert_called_once()
+        assert prs["feat-a"]["url"] == "https://gh/pull/3"
+        assert prs["https://gh/pull/2"]["state"] == "MERGED"
+        assert prs["https://gh/pull/1"]["state"] == "CLOSED"
+
+    @patch("beehive.cli_architect.subprocess.run")
+    def test_failure_returns_none(self, mock_run):
+        """gh failures return None so callers fall back to per-PR lookups."""
+        from beehive.cli_architect import _list_prs_for_repo
+
+        mock_run.return_value = MagicMock(returncode=1, stdout="")
+        assert _list_prs_for_repo("/tmp/repo") is None
+
+    @patch("beehive.cli_architect._list_prs_for_repo", return_value={})
+    def test_repo_prs_fetches_once(self, mock_list):
+        """The per-cycle cache only lists each repo once."""
+        from beehive.cli_architect import _repo_prs
+
+        cache = {}
+        paths = {"api": "/tmp/api"}
+        _repo_prs(cache, paths, "api")
+        _repo_prs(cache, paths, "api")
+        assert _repo_prs(cache, paths, "missing") is None
+        mock_list.assert_called_once_with("/tmp/api")
+
+    @patch("beehive.cli_architect._branch_pushed", side_effect=lambda b, _: b != "feat-d")
+    @patch("beehive.cli_architect._find_pr_for_branch", return_value="https://gh/pull/9")
+    def test_discover_pr_urls_falls_back_per_branch(self, mock_find, mock_pushed):
+        """Listed repos answer from the index; failed listings use per-branch lookups."""
+        from beehive.cli_architect import _discover_pr_urls
+
+        cache = {
+            "api": {"feat-a": {"url": "https://gh/pull/3", "state": "OPEN"}},
+            "web": None,
+        }
+        paths = {"api": "/tmp/api", "web": "/tmp/web"}
+        tickets = [
+            Ticket(ticket_id="t1", title="A", description="", repo="api", branch_name="feat-a"),
+            Ticket(ticket_id="t2", title="B", description="", repo="api", branch_name="feat-x"),
+            Ticket(ticket_id="t3", title="C", description="", repo="web", branch_name="feat-c"),
+            Ticket(ticket_id="t4", title="D", description="", repo="web", branch_name="feat-d"),
+        ]
+        urls = _discover_pr_urls(tickets, cache, paths)
+        assert urls == {
+            "t1": "https://gh/pull/3",
+            "t2": None,
+            "t3": "https://gh/pull/9",
+            "t4": None,
+        }
+        # Unpushed branches never reach gh
+        mock_find.assert_called_once_with("feat-c", "/tmp/web")
+
+    @patch("beehive.cli_architect._branch_pushed", return_value=True)
+    @patch("beehive.cli_architect._find_pr_for_branch", return_value="https://gh/pull/1")
+    @patch("beehive.cli_architect.subprocess.run")
+    def test_discover_pr_urls_truncated_listing_falls_back(self, mock_run, mock_find, mock_pushed):
+        """Branches missing from a listing that hit the limit are looked up directly."""
+        from beehive.cli_architect import _PR_LIST_LIMIT, _discover_pr_urls, _list_prs_for_repo
+
+        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([
+            {"url": f"https://gh/pull/{n}", "headRefName": f"b{n}", "state": "OPEN"}
+            for n in range(1000, 1000 + _PR_LIST_LIMIT)
+        ]))
+        prs = _list_prs_for_repo("/tmp/api")
+        assert not prs.complete
+
+        tickets = [
+            Ticket(ticket_id="t1", title="A", description="", repo="api", branch_name="b1000"),
+            Ticket(ticket_id="t2", title="B", description="", repo="api", branch_name="old"),
+        ]
+        urls = _discover_pr_urls(tickets, {"api": prs}, {"api": "/tmp/api"})
+        assert urls == {"t1": "https://gh/pull/1000", "t2": "https://gh/pull/1"}
+        mock_find.assert_called_once_with("old", "/tmp/api")
+
+    @patch("beehive.cli_architect.subprocess.run")
+    def test_branch_pushed(self, mock_run):
+        from beehive.cli_architect import _branch_pushed
+
+        mock_run.return_value = MagicMock(returncode=0)
+        assert _branch_pushed("feat-a", "/tmp/api") is True
+        assert mock_run.call_args.args[0] == [
+            "git", "ls-remote", "--exit-code", "--heads", "origin", "feat-a",
+        ]
+        mock_run.return_value = MagicMock(returncode=2)
+        assert _branch_pushed("feat-a", "/tmp/api") is False
+        # Other failures (no remote, network) still let gh decide
+        mock_run.return_value = MagicMock(returncode=128)
+        assert _branch_pushed("feat-a", "/tmp/api") is True
+
+    def test_next_discovery_delay_backs_off(self):
+        from beehive.cli_architect import _next_discovery_delay
+
+        delays = []
+        backoff = None
+        for _ in range(7):
+            delay = _next_discovery_delay(backoff)
+            delays.append(delay)
+            backoff = (0.0, delay)
+        assert delays == [5, 10, 20, 40, 80, 120, 120]
+
+    @patch("beehive.cli_architect._get_pr_state", return_value="MERGED")
+    def test_lookup_pr_states_falls_back_for_unlisted(self, mock_state):
+        """PRs missing from the listing are looked up individually."""
+        from beehive.cli_architect import _lookup_pr_states
+
+        cache = {"api": {"https://gh/pull/3": {"url": "https://gh/pull/3", "state": "OPEN"}}}
+        tickets = [
+            Ticket(title="A", description="", repo="api", pr_url="https://gh/pull/3"),
+            Ticket(title="B", description="", repo="api", pr_url="https://gh/pull/1"),
+        ]
+        states = _lookup_pr_states(tickets, cache, {"api": "/tmp/api"})
+        assert states == {"https://gh/pull/3": "OPEN", "https://gh/pull/1": "MERGED"}
+        mock_state.assert_called_once_with("https://gh/pull/1")
+
+
+class TestFindProjectForArchitect:
+    def test_index_reused_until_projects_change(self, tmp_path):
+        """Projects are scanned once and rescanned only after projects.json changes."""
+        from beehive.cli_architect import _find_project_for_architect
+        from beehive.core.project import Project
+        from beehive.core.project_storage import ProjectStorage
+
+        storage = ProjectStorage(tmp_path)
+        storage.save_project(Project(name="web", architect_ids=["arch1"]))
+
+        with patch.object(
+            ProjectStorage, "load_all_projects", autospec=True,
+            side_effect=ProjectStorage.load_all_projects,
+        ) as mock_load:
+            assert _find_project_for_architect("arch1", tmp_path).name == "web"
+            assert _find_project_for_architect("arch1", tmp_path).name == "web"
+            assert _find_project_for_architect("nope", tmp_path) is None
+            assert mock_load.call_count == 1
+
+            storage.save_project(Project(name="api", architect_ids=["arch2", "arch1x"]))
+            assert _find_project_for_architect("arch2", tmp_path).name == "api"
+            assert mock_load.call_count == 2
+
+    def test_no_projects_file_skips_scan(self, tmp_path):
+        """Without projects.json there is nothing to scan or create."""
+        from beehive.cli_architect import _find_project_for_architect
+
+        assert _find_project_for_architect("arch1", tmp_path) is None
+        assert not (tmp_path / "projects").exists()
+
+
+class TestTicketsByStatus:
+    def test_buckets_match_enum_and_raw_values(self):
+        """Buckets are addressable by TicketStatus whether tickets hold enums or strings."""
+        from beehive.cli_architect import _tickets_by_status
+
+        tickets = [
+            Ticket(title="T1", description="D", repo="api", status=TicketStatus.ASSIGNED),
+            Ticket(**Ticket(title="T2", description="D", repo="api").model_dump(mode="json")),
+            Ticket(title="T3", description="D", repo="api", status=TicketStatus.ASSIGNED),
+        ]
+        by_status = _tickets_by_status(tickets)
+        assert [t.title for t in by_status[TicketStatus.ASSIGNED]] == ["T1", "T3"]
+        assert [t.title for t in by_status[TicketStatus.PENDING]] == ["T2"]
+        assert by_status[TicketStatus.MERGED] == []
+
+
+class TestSyncTicketsFromSessions:
+    def test_single_session_read(self, tmp_path):
+        """All in-flight tickets are synced from one session listing."""
+        from beehive.cli_architect import _sync_tickets_from_sessions
+        from beehive.core.session import SessionManager, SessionStatus
+
+        session_mgr = SessionManager(tmp_path)
+        done = session_mgr.create_session("a", "x", Path("/tmp"))
+        failed = session_mgr.create_session("b", "x", Path("/tmp"))
+        session_mgr.update_session(done.session_id, status=SessionStatus.COMPLETED, pr_url="https://gh/pull/1")
+        session_mgr.update_session(failed.session_id, status=SessionStatus.STOPPED)
+
+        plan = Plan(directive="d", tickets=[
+            Ticket(title="A", description="D", repo="api", status=TicketStatus.ASSIGNED, session_id=done.session_id),
+            Ticket(title="B", description="D", repo="api", status=TicketStatus.IN_PROGRESS, session_id=failed.session_id),
+            Ticket(title="C", description="D", repo="api"),
+        ])
+
+        with patch.object(session_mgr, "get_session") as mock_get, \
+                patch.object(session_mgr, "get_sessions", wraps=session_mgr.get_sessions) as mock_bulk:
+            assert _sync_tickets_from_sessions(plan, session_mgr) is True
+            mock_get.assert_not_called()
+            assert mock_bulk.call_count == 1
+
+        assert plan.tickets[0].status == TicketStatus.COMPLETED
+        assert plan.tickets[0].pr_url == "https://gh/pull/1"
+        assert plan.tickets[1].status == TicketStatus.FAILED
+        assert plan.tickets[2].status == TicketStatus.PENDING
+
+
+class TestWatchPolling:
+    def test_next_poll_interval_backs_off_to_4x(self):
+        from beehive.cli_architect import _next_poll_interval
+
+        assert [_next_poll_interval(15, n) for n in range(5)] == [15, 30, 60, 60, 60]
+
+    def test_wait_for_wake_returns_early_on_sigusr1(self):
+        import os
+        import signal
+        import time
+
+        from beehive.cli_architect import _install_wake_handler, _wait_for_wake
+
+        event, previous = _install_wake_handler()
+        if event is None:
+            pytest.skip("SIGUSR1 handler not available")
+        try:
+            os.kill(os.getpid(), signal.SIGUSR1)
+            start = time.monotonic()
+            assert _wait_for_wake(5, event) is True
+            assert time.monotonic() - start < 1
+            assert _wait_for_wake(0.01, event) is False
+        finally:
+            signal.signal(signal.SIGUSR1, previous)
+
+    def test_wake_handler_leaves_child_signal_mask_alone(self):
+        import signal
+
+        from beehive.cli_architect import _install_wake_handler
+
+        if not Path("/proc/self/status").exists():
+            pytest.skip("needs /proc")
+        event, previous = _install_wake_handler()
+        if event is None:
+            pytest.skip("SIGUSR1 handler not available")
+        try:
+            status = subprocess.run(
+                ["cat", "/proc/self/status"], capture_output=True, text=True, check=True,
+            ).stdout
+        finally:
+            signal.signal(signal.SIGUSR1, previous)
+        blocked = int(next(l for l in status.splitlines() if l.startswith("SigBlk:")).split()[1], 16)
+        assert not blocked & (1 << (signal.SIGUSR1 - 1))
+
+
+class TestTicketRows:
+    def test_rows_in_order_with_placeholders(self):
+        from beehive.cli_architect import _ticket_rows
+
+        rows = _ticket_rows([
+            Ticket(ticket_id="t2", title="B", description="", repo="api", order=2,
+                   status=TicketStatus.MERGED, pr_url="https://gh/pull/2"),
+            Ticket(ticket_id="t0", title="Legacy", description="", repo="web"),
+        ])
+        assert [r[1] for r in rows] == ["t0", "t2"]
+        assert rows[0][0] == "—"
+        assert rows[0][5:] == ("", "", "")
+        assert rows[1][4].plain == "merged"
+        assert str(rows[1][4].style) == "cyan"
+        assert rows[1][7] == "https://gh/pull/2"
+
+    def test_status_cells_shared(self):
+        from beehive.cli_architect import _ticket_rows
+
+        rows = _ticket_rows([
+            Ticket(title="A", description="", repo="api", order=1),
+            Ticket(title="B", description="", repo="api", order=2),
+        ])
+        assert rows[0][4] is rows[1][4]
@@ -0,0 +1,42 @@
+"""Tests for top-level CLI commands."""
+
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+
+from beehive.cli import logs
+
+
+def _invoke_logs(tmp_path, session_manager, session_id):
+    with click.Context(logs, obj={"data_dir": tmp_path, "session_manager": session_manager}) as ctx:
+        ctx.invoke(logs, session_id=session_id, follow=False, lines=50)
+
+
+@patch("os.execvp")
+def test_logs_full_id_skips_session_lookup(mock_exec, tmp_path):
+    """Test an exact log file name is tailed without loading sessions."""
+    (tmp_path / "logs").mkdir()
+    log_file = tmp_path / "logs" / "abcd1234.log"
+    log_file.write_text("hi\n")
+    session_manager = MagicMock()
+
+    _invoke_logs(tmp_path, session_manager, "abcd1234")
+
+    session_manager.get_session.assert_not_called()
+    assert mock_exec.call_args.args[1][-1] == str(log_file)
+
+
+@patch("os.execvp")
+def test_logs_prefix_goes_through_session_lookup(mock_exec, tmp_path):
+    """Test a prefix never matches a stray log file directly."""
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "abcd1234.log").write_text("deleted session\n")
+    session_manager = MagicMock()
+    session_manager.get_session.return_value = None
+
+    with pytest.raises(SystemExit):
+        _invoke_logs(tmp_path, session_manager, "abcd")
+
+    session_manager.get_session.assert_called_once_with("abcd")
+    mock_exec.assert_not_called()
@@ -0,0 +1,67 @@
+"""Tests for helpers shared across CLI groups."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class TestCtxService:
+    def test_reuses_provided_managers(self, tmp_path):
+        from beehive.cli_common import session_stack
+
+        provided = {key: MagicMock() for key in ("session_manager", "tmux", "config", "docker")}
+        ctx = MagicMock(obj={"data_dir": tmp_path, **provided})
+        with patch("beehive.core.session.SessionManager") as mock_sm:
+            assert session_stack(ctx) == tuple(provided.values())
+            mock_sm.assert_not_called()
+
+    def test_builds_and_caches_missing_manager(self, tmp_path):
+        from beehive.cli_common import ctx_service
+        from beehive.core.session import SessionManager
+
+        ctx = MagicMock(obj={"data_dir": tmp_path})
+        session_mgr = ctx_service(ctx, "session_manager")
+        assert isinstance(session_mgr, SessionManager)
+        assert ctx_service(ctx, "session_manager") is session_mgr
+
+
+class TestRunAssignBatch:
+    def _items(self, n):
+        return [MagicMock(title=f"item-{i}") for i in range(n)]
+
+    def test_sequential_checkpoints_and_final_save(self):
+        from beehive.cli_common import ASSIGN_CHECKPOINT_EVERY, run_assign_batch
+
+        items = self._items(ASSIGN_CHECKPOINT_EVERY + 1)
+        save = MagicMock()
+        ids = run_assign_batch(items, lambda item: item.title, save, "items")
+        assert ids == [item.title for item in items]
+        # One checkpoint, one final save
+        assert save.call_count == 2
+
+    def test_parallel_keeps_order_and_reports_failures(self):
+        from beehive.cli_common import run_assign_batch
+
+        items = self._items(3)
+        save = MagicMock()
+        with patch("beehive.cli_common.console") as mock_console:
+            ids = run_assign_batch(
+                items, lambda item: None if item is items[1] else item.title,
+                save, "items", parallel=True,
+            )
+        assert ids == ["item-0", None, "item-2"]
+        save.assert_called_once()
+        tally = mock_console.print.call_args.args[0]
+        assert "2/3 items" in tally and "item-1" in tally
+
+    def test_saves_when_interrupted(self):
+        from beehive.cli_common import run_assign_batch
+
+        save = MagicMock()
+
+        def boom(item):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            run_assign_batch(self._items(2), boom, save, "items")
+        save.assert_called_once()
@@ -24,6 +24,16 @@ def test_system_prompt_none_when_missing(config):
     assert config.get_system_prompt() is None
 
 
+def test_system_prompt_reloads_after_external_edit(config):
+    config.set_system_prompt("Be concise.")
+    assert config.get_system_prompt() == "Be concise."
+    # Edited outside of set_system_prompt (e.g. via `$EDITOR`)
+    config.system_prompt_file.write_text("Be thorough and verbose.")
+    assert config.get_system_prompt() == "Be thorough and verbose."
+    config.system_prompt_file.unlink()
+    assert config.get_system_prompt() is None
+
+
 def test_combine_prompts_without_system_prompt(config):
     result = config.combine_prompts("Do X")
     assert "TASK INSTRUCTIONS" in result
@@ -69,6 +79,13 @@ def test_get_claude_md_returns_none_for_empty_file(config):
     assert config.get_claude_md() is None
 
 
+def test_get_claude_md_reloads_after_external_edit(config):
+    config.set_claude_md("# Rules")
+    assert config.get_claude_md() == "# Rules"
+    config.claude_md_file.write_text("# New rules, edited elsewhere")
+    assert config.get_claude_md() == "# New rules, edited elsewhere"
+
+
 def test_get_claude_md_path(config):
     assert config.get_claude_md_path() == config.data_dir / "CLAUDE.md"
 
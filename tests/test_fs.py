@@ -0,0 +1,35 @@
+"""Tests for filesystem helpers."""
+
+import os
+
+from beehive.utils.fs import atomic_write
+
+
+def test_atomic_write_creates_and_replaces(tmp_path):
+    """Test atomic_write creates a file and overwrites it in place."""
+    target = tmp_path / "prompt.txt"
+
+    old_umask = os.umask(0o022)
+    try:
+        atomic_write(target, b"first")
+    finally:
+        os.umask(old_umask)
+    assert target.read_bytes() == b"first"
+    assert target.stat().st_mode & 0o777 == 0o644
+
+    atomic_write(target, b"second")
+    assert target.read_bytes() == b"second"
+
+    # No temp files left behind
+    assert [p.name for p in tmp_path.iterdir()] == ["prompt.txt"]
+
+
+def test_atomic_write_keeps_existing_mode(tmp_path):
+    """Test overwriting a file preserves its permissions."""
+    target = tmp_path / "script.sh"
+    target.write_bytes(b"old")
+    target.chmod(0o750)
+
+    atomic_write(target, b"new")
+    assert target.read_bytes() == b"new"
+    assert target.stat().st_mode & 0o777 == 0o750
@@ -1,6 +1,11 @@
 """Tests for git operations."""
 
-from beehive.core.git_ops import generate_branch_name
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from beehive.core.git_ops import generate_branch_name, get_git_identity
 
 
 def test_generate_branch_name():
@@ -29,3 +34,83 @@ def test_generate_branch_name():
     long_name = "a" * 100
     name = generate_branch_name(long_name, "a1b2")
     assert len(name.split("/")[-1].replace("-a1b2", "")) <= 50
+
+
+@pytest.fixture
+def empty_git_home(tmp_path, monkeypatch):
+    """Point global git config lookups at an empty home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
+    monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+    get_git_identity.cache_clear()
+    yield tmp_path
+    get_git_identity.cache_clear()
+
+
+@patch("beehive.core.git_ops.subprocess.run")
+def test_get_git_identity(mock_run, empty_git_home):
+    """Test both identity values are parsed from one git call."""
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0,
+        stdout="user.name Global Name\nuser.email global@example.com\nuser.name Local Name\n",
+    )
+    assert get_git_identity() == ("Local Name", "global@example.com")
+    assert mock_run.call_count == 1
+
+
+@patch("beehive.core.git_ops.subprocess.run")
+def test_get_git_identity_defaults(mock_run, empty_git_home):
+    """Test fallback identity when git config has no user entries."""
+    mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=1, stdout="")
+    assert get_git_identity() == ("Beehive Agent", "agent@beehive")
+
+
+@patch("beehive.core.git_ops.subprocess.run")
+def test_get_git_identity_from_config_files(mock_run, empty_git_home):
+    """Test identity is read from config files without spawning git."""
+    (empty_git_home / ".gitconfig").write_text(
+        "[user]\n\tname = Global Name\n\temail = global@example.com\n"
+    )
+    repo = empty_git_home / "repo"
+    (repo / ".git").mkdir(parents=True)
+    (repo / ".git" / "config").write_text("[user]\n\tname = Local Name\n")
+
+    assert get_git_identity(repo) == ("Local Name", "global@example.com")
+    mock_run.assert_not_called()
+
+
+@patch("beehive.core.git_ops.subprocess.run")
+def test_get_git_identity_include_falls_back(mock_run, empty_git_home):
+    """Test config files with include directives defer to git."""
+    (empty_git_home / ".gitconfig").write_text(
+        "[include]\n\tpath = ~/.gitconfig.local\n"
+        "[user]\n\tname = Global Name\n\temail = global@example.com\n"
+    )
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="user.name Included Name\nuser.email inc@example.com\n",
+    )
+    assert get_git_identity() == ("Included Name", "inc@example.com")
+    assert mock_run.call_count == 1
+
+
+@patch("beehive.core.git_ops.subprocess.run")
+def test_get_git_identity_cached(mock_run, empty_git_home):
+    """Test repeated lookups for the same repo don't hit git again."""
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="user.name A\nuser.email a@example.com\n",
+    )
+    assert get_git_identity() == get_git_identity()
+    assert mock_run.call_count == 1
+
+
+@patch("beehive.core.git_ops.subprocess.run")
+def test_get_git_identity_quoted_value_falls_back(mock_run, empty_git_home):
+    """Test quoted values with comment characters are resolved by git, not configparser."""
+    (empty_git_home / ".gitconfig").write_text(
+        '[user]\n\tname = "Team #1 Bot"\n\temail = bot@example.com\n'
+    )
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="user.name Team #1 Bot\nuser.email bot@example.com\n",
+    )
+    assert get_git_identity() == ("Team #1 Bot", "bot@example.com")
+    assert mock_run.call_count == 1
@@ -0,0 +1,49 @@
+"""Tests for preview environment management."""
+
+import json
+import os
+import subprocess
+
+from beehive.core.preview import PreviewManager
+
+
+def test_alive_pids():
+    """Test live pids are kept and exited ones dropped in one check."""
+    proc = subprocess.Popen(["true"])
+    proc.wait()
+    assert PreviewManager._alive_pids([os.getpid(), proc.pid]) == {os.getpid()}
+    assert PreviewManager._alive_pids([]) == set()
+
+
+def test_list_previews_with_cleanup(tmp_path):
+    """Test dead entries are removed and live ones returned in one pass."""
+    proc = subprocess.Popen(["true"])
+    proc.wait()
+    mgr = PreviewManager(tmp_path)
+    mgr.state_file.write_text(json.dumps([
+        {"session_id": "live", "port": 3100, "pid": os.getpid(), "url": "http://a",
+         "working_directory": "/tmp/a", "setup_command": "npm run dev"},
+        {"session_id": "dead", "port": 3101, "pid": proc.pid, "url": "http://b",
+         "working_directory": "/tmp/b", "setup_command": "npm run dev"},
+    ]))
+
+    previews, removed = mgr.list_previews_with_cleanup()
+    assert [p.session_id for p in previews] == ["live"]
+    assert removed == 1
+    assert [p.session_id for p in mgr.list_previews()] == ["live"]
+
+
+def test_stop_all_previews(tmp_path):
+    """Test every tracked preview is torn down and the state cleared."""
+    mgr = PreviewManager(tmp_path)
+    mgr.state_file.write_text(json.dumps([
+        {"session_id": sid, "port": port, "pid": 999999999, "url": "http://x",
+         "working_directory": str(tmp_path), "setup_command": "true",
+         "teardown_command": f"touch {sid}.down"}
+        for sid, port in (("a", 3100), ("b", 3101))
+    ]))
+
+    assert mgr.stop_all_previews() == ["a", "b"]
+    assert (tmp_path / "a.down").exists() and (tmp_path / "b.down").exists()
+    assert mgr.list_previews() == []
+    assert mgr.stop_all_previews() == []
@@ -177,6 +177,55 @@ class TestProjectStorage:
 # --- Conversation Tests ---
 
 
+class TestGetStorage:
+    def test_storages_built_once_per_context(self, tmp_path):
+        from beehive.cli_project import _get_storage
+
+        session_mgr = MagicMock()
+        ctx = MagicMock(obj={"data_dir": tmp_path, "session_manager": session_mgr})
+        first = _get_storage(ctx)
+        assert isinstance(first[0], ProjectStorage)
+        assert first[2] is session_mgr
+        assert _get_storage(ctx) == first
+
+
+class TestUpdateFields:
+    def test_update_fields(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = ProjectStorage(Path(tmpdir))
+            storage.save_project(Project(project_id="proj1234", name="test", description="keep"))
+
+            assert storage.update_fields("proj1234", architect_ids=["a1", "a2"])
+            loaded = storage.load_project("proj1234")
+            assert loaded.architect_ids == ["a1", "a2"]
+            assert loaded.description == "keep"
+            assert not storage.update_fields("missing1", architect_ids=[])
+
+
+class TestMarkdownRender:
+    def test_large_text_rendered_plain(self):
+        from rich.markdown import Markdown
+        from rich.text import Text
+
+        from beehive.cli_project import _MARKDOWN_MAX_CHARS, _markdown
+
+        assert isinstance(_markdown("# Title"), Markdown)
+        assert _markdown("# Title") is _markdown("# Title")
+        big = "x" * (_MARKDOWN_MAX_CHARS + 1)
+        assert isinstance(_markdown(big), Text)
+
+
+class TestProjectRows:
+    def test_rows_with_placeholders(self):
+        from beehive.cli_project import _project_rows
+
+        (row,) = _project_rows([Project(
+            project_id="proj1234", name="test", description="x" * 50,
+            architect_ids=["a1", "a2"], created_at=datetime(2024, 1, 2, 3, 4),
+        )])
+        assert row == ("proj1234", "test", "x" * 40 + "...", "—", "2", "2024-01-02 03:04")
+
+
 class TestConversation:
     def test_save_and_load_conversation(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -215,6 +264,18 @@ class TestConversation:
             assert conv.messages[1].content == "Response"
             assert conv.messages[2].content == "Follow-up"
 
+    def test_load_conversation_tail(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = ProjectStorage(Path(tmpdir))
+            assert storage.load_conversation_tail("proj1234", 2) == ([], 0)
+
+            for text in ("one", "two", "three"):
+                storage.append_message("proj1234", CTOMessageRole.USER, text)
+
+            messages, total = storage.load_conversation_tail("proj1234", 2)
+            assert total == 3
+            assert [m.content for m in messages] == ["two", "three"]
+
     def test_clear_conversation(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             storage = ProjectStorage(Path(tmpdir))
@@ -362,3 +423,24 @@ class TestCTO:
 
             assert "bitbook" in raw_data
             assert ai_summary == "Project is on track."
+
+
+class TestCTOChatPiped:
+    def test_piped_lines_are_sent_without_newlines(self):
+        import io
+
+        import click
+
+        from beehive.cli_project import cto_chat
+
+        project_storage = MagicMock()
+        with patch("beehive.cli_project._get_storage",
+                   return_value=(project_storage, MagicMock(), MagicMock())), \
+                patch("beehive.core.cto.CTO") as mock_cto_cls, \
+                patch("sys.stdin", io.StringIO("first question\n\nsecond\n")):
+            mock_cto_cls.return_value.chat.return_value = "ok"
+            with click.Context(cto_chat, obj={}) as ctx:
+                ctx.invoke(cto_chat, project_id="p1", clear=False)
+
+        chat = mock_cto_cls.return_value.chat
+        assert [c.args[0] for c in chat.call_args_list] == ["first question", "second"]
@@ -0,0 +1,68 @@
+"""Tests for researcher models."""
+
+from beehive.core.architect import ArchitectRepo
+from beehive.core.researcher import Researcher
+
+
+def test_researcher_get_repo():
+    """Test repos are looked up by name, first match winning."""
+    res = Researcher(
+        name="test",
+        principles="",
+        repos=[ArchitectRepo(name="api", path="/tmp/api"),
+               ArchitectRepo(name="api", path="/tmp/api-dup")],
+    )
+    assert res.get_repo("api").path == "/tmp/api"
+    assert res.get_repo("web") is None
+
+    res.repos.append(ArchitectRepo(name="web", path="/tmp/web"))
+    assert res.get_repo("web").path == "/tmp/web"
+
+
+def test_sync_experiments_single_lookup():
+    """Test in-flight experiments are synced from one bulk session lookup."""
+    from unittest.mock import MagicMock
+
+    from beehive.cli_researcher import _sync_experiments_from_sessions
+    from beehive.core.researcher import Experiment, ExperimentStatus, Study
+
+    study = Study(directive="d", experiments=[
+        Experiment(title="a", description="", repo="api",
+                   status=ExperimentStatus.ASSIGNED, session_id="s1"),
+        Experiment(title="b", description="", repo="api",
+                   status=ExperimentStatus.IN_PROGRESS, session_id="s2"),
+        Experiment(title="c", description="", repo="api", session_id="s3"),
+    ])
+    session_mgr = MagicMock()
+    session_mgr.get_sessions.return_value = {
+        "s1": MagicMock(status="completed", working_directory="/tmp/wt1"),
+    }
+
+    assert _sync_experiments_from_sessions(study, session_mgr)
+    assert session_mgr.get_sessions.call_count == 1
+    assert list(session_mgr.get_sessions.call_args.args[0]) == ["s1", "s2"]
+    session_mgr.get_session.assert_not_called()
+    assert study.experiments[0].status == "completed"
+    assert study.experiments[0].output_dir == "/tmp/wt1"
+    assert study.experiments[1].status == "in_progress"
+
+
+def test_assign_single_experiment_unknown_repo():
+    """Test an experiment for a repo the researcher doesn't own is skipped."""
+    from unittest.mock import MagicMock
+
+    from beehive.cli_researcher import _assign_single_experiment
+    from beehive.core.researcher import Experiment, Study
+
+    experiment = Experiment(title="a", description="", repo="missing")
+    study = Study(directive="d", experiments=[experiment])
+    res = Researcher(name="test", principles="", repos=[])
+    session_mgr = MagicMock()
+    storage = MagicMock()
+
+    assert _assign_single_experiment(
+        experiment, study, res, storage, "/tmp", session_mgr, MagicMock(),
+        MagicMock(), MagicMock(), True, False, MagicMock(),
+    ) is None
+    session_mgr.create_session.assert_not_called()
+    storage.save_study.assert_not_called()
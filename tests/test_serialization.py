@@ -0,0 +1,36 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+
+import pytest
+
+from beehive.utils import serialization
+from beehive.utils.serialization import dumps_pretty, json_loads
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_pretty_matches_stdlib_layout(monkeypatch, use_orjson):
+    """Test output is byte-identical to json.dumps(indent=2) for plain data."""
+    if use_orjson and serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+
+    data = [
+        {"plan_id": "p1", "tickets": [], "auto_merge": False, "order": 3, "pr_url": None},
+        {"plan_id": "p2", "tickets": [{"title": "T", "processed": [1, 2]}], "nested": {}},
+    ]
+    assert dumps_pretty(data) == json.dumps(data, indent=2, default=str)
+    assert dumps_pretty([]) == "[]"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_loads_accepts_bytes_and_str(monkeypatch, use_orjson):
+    """Test raw subprocess output parses the same as text."""
+    if use_orjson and serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+
+    raw = '[{"url": "https://gh/pull/1", "state": "OPEN"}]'
+    assert json_loads(raw.encode()) == json_loads(raw) == json.loads(raw)
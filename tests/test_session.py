@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -160,3 +161,39 @@ def test_session_manager_delete():
         # Verify deleted
         retrieved = manager.get_session(session.session_id)
         assert retrieved is None
+
+
+def test_auto_complete_sessions_single_docker_snapshot():
+    """Test exited containers are detected from one `docker ps` listing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = SessionManager(Path(tmpdir))
+        alive = manager.create_session("alive", "x", Path("/tmp"), use_docker=True)
+        exited = manager.create_session("exited", "x", Path("/tmp"), use_docker=True)
+        host = manager.create_session("host", "x", Path("/tmp"))
+
+        with patch(
+            "beehive.core.docker_manager.DockerManager.list_running_container_names",
+            return_value={alive.container_name},
+        ) as mock_ps:
+            completed = manager.auto_complete_sessions()
+
+        assert completed == [exited.session_id]
+        assert mock_ps.call_count == 1
+        assert manager.get_session(alive.session_id).status == SessionStatus.RUNNING
+        assert manager.get_session(host.session_id).status == SessionStatus.RUNNING
+
+
+def test_auto_complete_sessions_skips_docker_check_when_unreachable():
+    """Test a failed `docker ps` doesn't mark live docker sessions complete."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = SessionManager(Path(tmpdir))
+        session = manager.create_session("alive", "x", Path("/tmp"), use_docker=True)
+
+        with patch(
+            "beehive.core.docker_manager.DockerManager.list_running_container_names",
+            return_value=None,
+        ) as mock_ps:
+            assert manager.auto_complete_sessions() == []
+
+        assert mock_ps.call_count == 1
+        assert manager.get_session(session.session_id).status == SessionStatus.RUNNING
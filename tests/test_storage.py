@@ -1,5 +1,6 @@
 """Tests for storage layer."""
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -75,6 +76,57 @@ def test_partial_id_matching():
         assert storage.load_session("z9z9") is None
 
 
+def test_load_session_only_validates_match():
+    """Test load_session doesn't build models for unrelated records."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SessionStorage(Path(tmpdir))
+
+        session = AgentSession(
+            session_id="a1b2c3d4",
+            name="test",
+            branch_name="beehive/test",
+            instructions="Test",
+            tmux_session_name="beehive-a1b2",
+            log_file="/tmp/test.log",
+            working_directory="/tmp/worktree",
+            original_repo="/tmp/repo",
+        )
+        storage.save_session(session)
+
+        # An unrelated record that would fail validation
+        data = json.loads(storage.sessions_file.read_text())
+        data.insert(0, {"session_id": "ffff0000"})
+        storage.sessions_file.write_text(json.dumps(data))
+
+        loaded = storage.load_session("a1b2")
+        assert loaded is not None
+        assert loaded.name == "test"
+
+
+def test_load_sessions_by_exact_ids():
+    """Test bulk loading returns only the requested sessions."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SessionStorage(Path(tmpdir))
+
+        for sid in ("a1b2c3d4", "a1b2ffff", "e5f6a7b8"):
+            storage.save_session(AgentSession(
+                session_id=sid,
+                name=f"test-{sid}",
+                branch_name=f"beehive/{sid}",
+                instructions="Test",
+                tmux_session_name=f"beehive-{sid}",
+                log_file="/tmp/test.log",
+                working_directory="/tmp/worktree",
+                original_repo="/tmp/repo",
+            ))
+
+        loaded = storage.load_sessions(["a1b2c3d4", "e5f6a7b8", "missing1"])
+        assert sorted(s.session_id for s in loaded) == ["a1b2c3d4", "e5f6a7b8"]
+        # Exact match only: a prefix doesn't select a session
+        assert storage.load_sessions(["a1b2"]) == []
+        assert storage.load_sessions([]) == []
+
+
 def test_load_all_sessions():
     """Test loading all sessions."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,75 @@
+"""Tests for cached YAML config loading."""
+
+import os
+from unittest.mock import patch
+
+import yaml
+
+from beehive.utils.yaml_cache import load_yaml_config
+
+
+def test_load_yaml_config_without_cache(tmp_path):
+    """Test plain parsing when no cache directory is given."""
+    config = tmp_path / "arch.yaml"
+    config.write_text("principles: Keep it simple\nrepos:\n  - name: api\n    path: /tmp/api\n")
+
+    assert load_yaml_config(config) == {
+        "principles": "Keep it simple",
+        "repos": [{"name": "api", "path": "/tmp/api"}],
+    }
+
+
+def test_load_yaml_config_reuses_cache_until_file_changes(tmp_path):
+    """Test an unchanged file is served from the JSON cache."""
+    config = tmp_path / "arch.yaml"
+    config.write_text("principles: one\n")
+    cache_dir = tmp_path / "cache"
+
+    assert load_yaml_config(config, cache_dir) == {"principles": "one"}
+    assert len(list(cache_dir.iterdir())) == 1
+
+    with patch.object(yaml, "load", side_effect=AssertionError("reparsed")):
+        assert load_yaml_config(config, cache_dir) == {"principles": "one"}
+
+    # Same size, same mtime: only the content hash tells them apart
+    st = config.stat()
+    config.write_text("principles: two\n")
+    os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert load_yaml_config(config, cache_dir) == {"principles": "two"}
+
+
+def test_load_yaml_config_cache_survives_touch(tmp_path):
+    """Test a new mtime on unchanged content still hits the cache."""
+    config = tmp_path / "arch.yaml"
+    config.write_text("principles: one\n")
+    cache_dir = tmp_path / "cache"
+    load_yaml_config(config, cache_dir)
+
+    os.utime(config, ns=(0, 0))
+    with patch.object(yaml, "load", side_effect=AssertionError("reparsed")):
+        assert load_yaml_config(config, cache_dir) == {"principles": "one"}
+
+
+def test_load_yaml_config_ignores_corrupt_cache(tmp_path):
+    """Test an unreadable cache entry is re-parsed and replaced."""
+    config = tmp_path / "arch.yaml"
+    config.write_text("principles: one\n")
+    cache_dir = tmp_path / "cache"
+    load_yaml_config(config, cache_dir)
+
+    cache_file = next(cache_dir.iterdir())
+    cache_file.write_bytes(b"not json")
+    assert load_yaml_config(config, cache_dir) == {"principles": "one"}
+    assert cache_file.read_bytes() != b"not json"
+
+
+def test_load_yaml_config_skips_cache_for_non_json_values(tmp_path):
+    """Test values JSON can't round-trip (dates, int keys) are never cached."""
+    config = tmp_path / "arch.yaml"
+    config.write_text("created: 2024-01-02\n1: one\n")
+    cache_dir = tmp_path / "cache"
+
+    data = load_yaml_config(config, cache_dir)
+    assert str(data["created"]) == "2024-01-02"
+    assert data[1] == "one"
+    assert not cache_dir.exists() or not list(cache_dir.iterdir())